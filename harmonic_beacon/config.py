@@ -16,6 +16,10 @@ F1_MAX = 65.0   # A1 (Reduced range)
 # Lower = smoother but slower response
 F1_SMOOTHING_RATE = 0.1
 
+# Minimum f₁ change (in cents) before active voices are re-sent during a
+# slide; smaller steps are inaudible and only add OSC/MPE traffic
+F1_UPDATE_THRESHOLD_CENTS = 0.5
+
 # =============================================================================
 # Keyboard Mapping
 # =============================================================================
@@ -183,3 +187,6 @@ UPDATE_RATE = 1000
 
 # MIDI polling interval (seconds)
 MIDI_POLL_INTERVAL = 0.001
+
+# Longest wait for MIDI input when nothing is animating (f₁ settled, no LFOs)
+MIDI_IDLE_TIMEOUT = 0.05
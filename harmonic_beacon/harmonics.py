@@ -6,6 +6,8 @@ mapping MIDI notes to the Natural Harmonic Series.
 
 import math
 
+from . import config
+
 # Harmonic lookup table: MIDI key offset (0-11) → Harmonic number (n)
 # Based on the spec's 12-key octave mapping
 HARMONIC_MAP: dict[int, int] = {
@@ -46,6 +48,17 @@ FREQ_A4 = 440.0
 # Maximum harmonic frequency (hearing limit)
 MAX_HARMONIC_FREQ = 20000.0
 
+# Cents above the fundamental for harmonics 1..MAX_HARMONIC
+# (HARMONIC_CENTS[n - 1] == 1200 * log2(n)), precomputed for hot-path searches
+HARMONIC_CENTS: tuple[float, ...] = tuple(
+    1200.0 * math.log2(n) for n in range(1, config.MAX_HARMONIC + 1)
+)
+
+# 12-TET frequency of every MIDI note 0-127
+_MIDI_TO_HZ: tuple[float, ...] = tuple(
+    FREQ_A4 * (2.0 ** ((n - MIDI_A4) / 12.0)) for n in range(128)
+)
+
 
 def get_harmonic_number(midi_note: int) -> int:
     """Map a MIDI note number to its corresponding harmonic number (12-key mode).
@@ -217,12 +230,16 @@ def octave_reduce(n: int) -> tuple[float, int]:
 def get_standard_frequency(midi_note: int) -> float:
     """Get the standard frequency for a MIDI note (A4=440Hz ET).
     
+    Notes 0-127 are served from a precomputed table.
+    
     Args:
         midi_note: MIDI note number
         
     Returns:
         Frequency in Hz
     """
+    if 0 <= midi_note < 128:
+        return _MIDI_TO_HZ[midi_note]
     return FREQ_A4 * (2.0 ** ((midi_note - MIDI_A4) / 12.0))
 
 
@@ -25,6 +25,10 @@ from . import config
 MIDI_A4 = 69
 FREQ_A4 = 440.0
 
+# Local matching (nearest natural harmonic instead of the prototype) is
+# disabled to prioritize simple harmonic ratios, see KeyMapper._build_mapping.
+USE_LOCAL_MATCHES = False
+
 
 def harmonic_to_cents(n: int) -> float:
     """Calculate the distance of harmonic n from the fundamental in cents."""
@@ -85,15 +89,16 @@ class KeyMapper:
         self.lowest_midi = lowest_midi
         self.highest_midi = highest_midi
         
-        # Build the mapping table: midi_note -> KeyMatch
-        self._mapping: dict[int, KeyMatch] = {}
+        # Build the mapping table: flat list indexed by midi_note (0-127)
+        self._mapping: list[Optional[KeyMatch]] = [None] * 128
         self._build_mapping()
     
     def _build_mapping(self) -> None:
         """Build the lookup table for all keys."""
         prototypes = config.CHROMATIC_PROTOTYPES
+        mapping: list[Optional[KeyMatch]] = [None] * 128
         
-        for midi in range(self.lowest_midi, self.highest_midi + 1):
+        for midi in range(max(0, self.lowest_midi), min(127, self.highest_midi) + 1):
             # 1. Determine Interval Class (0-11)
             # anchor_midi corresponds to interval 0
             rel_semitones = midi - self.anchor_midi
@@ -124,20 +129,23 @@ class KeyMapper:
             best_local_n = None
             best_local_dev = float('inf')
             
-            # Optimization: Estimate n for target_freq: n = target_freq / f1
-            center_n_float = target_freq / self.f1
-            search_radius = 2 # Check neighbors
-            
-            start_n = max(1, int(math.floor(center_n_float - search_radius)))
-            end_n = int(math.ceil(center_n_float + search_radius))
-            
-            for n in range(start_n, end_n + 1):
-                f_n = self.f1 * n
-                # Deviation from target
-                dev = 1200.0 * math.log2(f_n / target_freq)
-                if abs(dev) < abs(best_local_dev):
-                    best_local_dev = dev
-                    best_local_n = n
+            # Skipped entirely while local matching is disabled (the scan
+            # costs a log2 per candidate and runs on every rebuild)
+            if USE_LOCAL_MATCHES:
+                # Optimization: Estimate n for target_freq: n = target_freq / f1
+                center_n_float = target_freq / self.f1
+                search_radius = 2 # Check neighbors
+                
+                start_n = max(1, int(math.floor(center_n_float - search_radius)))
+                end_n = int(math.ceil(center_n_float + search_radius))
+                
+                for n in range(start_n, end_n + 1):
+                    f_n = self.f1 * n
+                    # Deviation from target
+                    dev = 1200.0 * math.log2(f_n / target_freq)
+                    if abs(dev) < abs(best_local_dev):
+                        best_local_dev = dev
+                        best_local_n = n
             
             # 4. Select Best Match
             # Local matching is DISABLED (forced to False) to prioritize simple harmonic ratios
@@ -146,8 +154,8 @@ class KeyMapper:
             # If enabled, local matching would find the nearest harmonic to 12TET pitch,
             # but this creates inconsistent interval relationships across the keyboard.
             use_local = False
-            # Disabled: if best_local_n is not None and abs(best_local_dev) < abs(proto_cents):
-            #     use_local = True
+            if USE_LOCAL_MATCHES and best_local_n is not None and abs(best_local_dev) < abs(proto_cents):
+                use_local = True
             
             if use_local and best_local_n is not None:
                 # Local match wins
@@ -160,6 +168,7 @@ class KeyMapper:
                 # Secondary is typically same as primary if local
                 secondary_n = primary_n
                 secondary_f = primary_f
+                effective_n = primary_n
                 
             else:
                 # Prototype wins
@@ -199,7 +208,7 @@ class KeyMapper:
                 secondary_n = proto_n
                 secondary_f = proto_f
             
-            self._mapping[midi] = KeyMatch(
+            mapping[midi] = KeyMatch(
                 midi_note=midi,
                 primary_freq=primary_f,
                 primary_n=effective_n, # Now calculating effective N (e.g. 6.0 for 3*2)
@@ -209,10 +218,14 @@ class KeyMapper:
                 is_transposed=is_transposed,
                 source_type=source_type
             )
+        
+        self._mapping = mapping
 
     def get_match(self, midi_note: int) -> Optional[KeyMatch]:
         """Get the match for a MIDI key."""
-        return self._mapping.get(midi_note)
+        if 0 <= midi_note < 128:
+            return self._mapping[midi_note]
+        return None
     
     def rebuild(
         self,
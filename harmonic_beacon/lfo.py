@@ -21,6 +21,8 @@ class HarmonicLFO:
     through them to create a chorus/vibrato effect.
     """
     
+    __slots__ = ("rate", "mode", "phase", "_frequencies", "_log_frequencies", "_base_frequency")
+    
     def __init__(
         self,
         rate: float = 1.0,
@@ -36,8 +38,27 @@ class HarmonicLFO:
         self.mode = mode
         self.phase = 0.0  # 0.0 to 1.0
         self._frequencies: list[float] = []
+        self._log_frequencies: list[float] = []  # log2 of each frequency
         self._base_frequency: float = 440.0
         
+    def reset(
+        self,
+        rate: float,
+        mode: VibratoMode,
+        frequencies: list[float],
+    ) -> None:
+        """Re-initialize a (pooled) LFO for a new note.
+        
+        Args:
+            rate: LFO frequency in Hz
+            mode: Smooth or stepped interpolation
+            frequencies: List of harmonic frequencies in Hz
+        """
+        self.rate = rate
+        self.mode = mode
+        self.phase = 0.0
+        self.set_harmonics(frequencies)
+        
     def set_harmonics(self, frequencies: list[float]) -> None:
         """Set the list of frequencies to sweep through.
         
@@ -45,6 +66,8 @@ class HarmonicLFO:
             frequencies: List of harmonic frequencies in Hz
         """
         self._frequencies = frequencies if frequencies else [440.0]
+        # Smooth mode interpolates in log space; take the logs once here
+        self._log_frequencies = [math.log2(f) for f in self._frequencies]
         if len(self._frequencies) == 1:
             self._base_frequency = self._frequencies[0]
         else:
@@ -63,33 +86,33 @@ class HarmonicLFO:
         Returns:
             Current frequency in Hz
         """
-        if len(self._frequencies) <= 1:
-            return self._frequencies[0] if self._frequencies else 440.0
+        frequencies = self._frequencies
+        n = len(frequencies)
+        if n <= 1:
+            return frequencies[0] if frequencies else 440.0
         
-        # Advance phase
-        self.phase += self.rate * dt
-        self.phase = self.phase % 1.0  # Wrap to [0, 1)
+        # Advance phase, wrapped to [0, 1)
+        phase = (self.phase + self.rate * dt) % 1.0
+        self.phase = phase
         
         # Triangle wave: 0→1→0 over one cycle
-        triangle = 1.0 - abs(2.0 * self.phase - 1.0)
+        triangle = 1.0 - abs(2.0 * phase - 1.0)
         
-        if self.mode == VibratoMode.STEPPED:
+        if self.mode is VibratoMode.STEPPED:
             # Stepped: quantize to discrete harmonic indices
-            n = len(self._frequencies)
             index = int(triangle * n)
             index = min(index, n - 1)  # Clamp
-            return self._frequencies[index]
+            return frequencies[index]
         else:
             # Smooth: interpolate between frequencies
-            n = len(self._frequencies)
             position = triangle * (n - 1)
             lower_idx = int(position)
             upper_idx = min(lower_idx + 1, n - 1)
             frac = position - lower_idx
             
             # Linear interpolation in log space (sounds more natural)
-            log_lower = math.log2(self._frequencies[lower_idx])
-            log_upper = math.log2(self._frequencies[upper_idx])
+            log_lower = self._log_frequencies[lower_idx]
+            log_upper = self._log_frequencies[upper_idx]
             log_result = log_lower + frac * (log_upper - log_lower)
             return 2.0 ** log_result
     
@@ -129,8 +152,8 @@ class HarmonicLFO:
             upper_idx = min(lower_idx + 1, n - 1)
             frac = position - lower_idx
             
-            log_lower = math.log2(self._frequencies[lower_idx])
-            log_upper = math.log2(self._frequencies[upper_idx])
+            log_lower = self._log_frequencies[lower_idx]
+            log_upper = self._log_frequencies[upper_idx]
             return 2.0 ** (log_lower + frac * (log_upper - log_lower))
     
     @property
@@ -5,25 +5,51 @@ in a real-time event loop.
 """
 
 import argparse
+import bisect
+import logging
 import math
 import signal
 import sys
+import threading
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 import mido # MIDI support
 
 from . import config
 from .harmonics import (
+    HARMONIC_CENTS,
     beacon_frequency,
     frequency_to_midi_float,
+    get_standard_frequency,
 )
 from .key_mapper import KeyMapper
 from .lfo import HarmonicLFO, VibratoMode
 from .midi_handler import MidiHandler
 from .osc_sender import OscSender, MockOscSender
 from .mpe_sender import MpeSender, MockMpeSender
-from .polyphony import VoiceTracker
+from .polyphony import VoicePair, VoiceTracker
+
+log = logging.getLogger(__name__)
+
+
+def _discard_log(msg: str, *args) -> None:
+    """Stand-in for log.info when a beacon is not verbose."""
+
+# Pad layouts (resolved once from config.PAD_MAP_TYPE)
+_LAYOUT_LINEAR = 0
+_LAYOUT_LAUNCHPAD = 1
+
+# Maximum number of idle HarmonicLFOs kept for reuse
+_LFO_POOL_MAX = 64
+
+# f₁ ratio equivalent to config.F1_UPDATE_THRESHOLD_CENTS
+_F1_UPDATE_RATIO = 2.0 ** (config.F1_UPDATE_THRESHOLD_CENTS / 1200.0)
+
+# Pitch-class names for status messages
+_NOTE_NAMES: tuple[str, ...] = (
+    'C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B',
+)
 
 
 class F1Modulator:
@@ -33,6 +59,8 @@ class F1Modulator:
     rather than jumping instantly.
     """
     
+    __slots__ = ("value", "target", "rate", "min_freq", "max_freq", "is_stable", "_cc_targets")
+    
     def __init__(
         self,
         initial: float = config.DEFAULT_F1,
@@ -53,6 +81,12 @@ class F1Modulator:
         self.rate = smoothing_rate
         self.min_freq = min_freq
         self.max_freq = max_freq
+        # Whether f₁ has reached its target (refreshed by update/set_target)
+        self.is_stable = True
+        # Target f₁ for each CC value 0-127 (linear over the range)
+        self._cc_targets: tuple[float, ...] = tuple(
+            min_freq + (cc / 127.0) * (max_freq - min_freq) for cc in range(128)
+        )
         
     def set_target_from_cc(self, cc_value: int) -> None:
         """Set target f₁ from a MIDI CC value (0-127).
@@ -60,9 +94,9 @@ class F1Modulator:
         Args:
             cc_value: CC value (0-127) to map to frequency range
         """
-        # Map CC 0-127 to frequency range
-        normalized = cc_value / 127.0
-        self.target = self.min_freq + normalized * (self.max_freq - self.min_freq)
+        # Map CC 0-127 to frequency range (precomputed)
+        self.target = self._cc_targets[cc_value]
+        self.is_stable = abs(self.target - self.value) < 0.01
         
     def set_target(self, frequency: float) -> None:
         """Set target f₁ directly in Hz.
@@ -71,21 +105,31 @@ class F1Modulator:
             frequency: Target frequency in Hz (clamped to range)
         """
         self.target = max(self.min_freq, min(self.max_freq, frequency))
+        self.is_stable = abs(self.target - self.value) < 0.01
         
     def update(self) -> bool:
         """Perform one interpolation step.
         
+        Once the remaining distance drops below 0.01 Hz the value snaps
+        to the target, so idle calls return on the first comparison.
+        
         Returns:
             True if value changed meaningfully (> 0.01 Hz)
         """
-        old_value = self.value
-        self.value += (self.target - self.value) * self.rate
-        return abs(self.value - old_value) > 0.01
-    
-    @property
-    def is_stable(self) -> bool:
-        """Whether f₁ has reached its target."""
-        return abs(self.value - self.target) < 0.01
+        value = self.value
+        target = self.target
+        if value == target:
+            return False
+        d = target - value
+        step = d * self.rate
+        remaining = d - step
+        if -0.01 < remaining < 0.01:
+            self.value = target
+            self.is_stable = True
+            return d > 0.01 or d < -0.01
+        self.value = value + step
+        self.is_stable = False
+        return step > 0.01 or step < -0.01
 
 
 class HarmonicBeacon:
@@ -95,6 +139,22 @@ class HarmonicBeacon:
     and OSC output in a real-time loop.
     """
     
+    # Slotted: the hot handlers touch many of these per event
+    __slots__ = (
+        "verbose", "_log_info", "running",
+        "stacking_mode_enabled", "stacking_mix",
+        "pad_mode_enabled", "split_mode_enabled", "toggled_harmonics",
+        "_pad_layout", "_pad_feedback_on", "_pad_feedback_toggle",
+        "_pad_off_msgs", "_pad_light_msgs",
+        "_pad_n_full", "_pad_n_split", "_pad_latch",
+        "_note_lfos", "_active_chorus_notes", "_lfo_pool",
+        "_last_update_time", "_last_sent_f1",
+        "_last_harmonic_idx",
+        "midi", "modulation_port_pattern", "secondary_midi",
+        "osc", "voices", "f1", "mpe_enabled", "mpe",
+        "_key_mapper", "_note_on_impl", "_cc_handlers",
+    )
+    
     def __init__(
         self,
         mock_osc: bool = False,
@@ -113,37 +173,60 @@ class HarmonicBeacon:
             enable_mpe: If True, enable MPE output via virtual MIDI port
             mock_mpe: If True, use MockMpeSender for testing
             modulation_port_pattern: Pattern to match secondary MIDI controller name
-            verbose: If True, print status messages
+            verbose: If True, print startup/shutdown status and log per-event
+                messages (module logger, INFO level); False silences both
             midi_debug: If True, print all incoming MIDI messages
         """
         self.verbose = verbose
+        self._log_info = log.info if verbose else _discard_log
         self.running = False
         
         # Stacking Mode (CC22) and Mix (CC67)
         self.stacking_mode_enabled = False # Toggled by CC22
         self.stacking_mix = config.DEFAULT_STACKING_MIX
         
-
-        
         # Pad Mode (Akai Force)
         self.pad_mode_enabled = config.PAD_MODE_ENABLED_BY_DEFAULT
         self.split_mode_enabled = config.SPLIT_MODE_ENABLED_BY_DEFAULT
-        self.toggled_harmonics: set[int] = set() # For Split Mode latching
-
-
+        self.toggled_harmonics: int = 0 # Bitmask of latched harmonics (bit n), Split Mode
+        
+        # Pad layout and feedback colors (resolved once, read per pad event)
+        if getattr(config, 'PAD_MAP_TYPE', 'LINEAR') == 'LAUNCHPAD':
+            self._pad_layout = _LAYOUT_LAUNCHPAD
+        else:
+            self._pad_layout = _LAYOUT_LINEAR
+        self._pad_feedback_on = config.PAD_FEEDBACK_COLOR_ON
+        self._pad_feedback_toggle = getattr(config, 'PAD_FEEDBACK_COLOR_TOGGLE_ON', 21)
+        
+        # Pre-built pad feedback messages (reused instead of rebuilt per event)
+        self._pad_off_msgs = [
+            mido.Message('note_off', note=n, velocity=0, channel=0) for n in range(128)
+        ]
+        self._pad_light_msgs: dict[tuple[int, int, int], mido.Message] = {}
+        
+        # Pad note -> harmonic tables (layout is static, so map once)
+        self._build_pad_tables()
         
         # Per-note LFOs for harmonic chorus
         self._note_lfos: dict[int, HarmonicLFO] = {}
-        self._last_update_time = time.time()
+        self._active_chorus_notes: set[int] = set()  # Notes whose LFO sweeps >1 harmonic
+        self._lfo_pool: list[HarmonicLFO] = []  # Released LFOs, reused on note-on
+        self._last_update_time = time.monotonic_ns()  # Loop timestamp (ns)
+        self._last_sent_f1: Optional[float] = None  # f₁ of the last pitch-expression update
+        self._last_harmonic_idx = 0  # HARMONIC_CENTS index of the last modulation match
         
-        # Initialize components
-        self.midi = MidiHandler(debug=midi_debug)
+        # Initialize components (both MIDI handlers share one wake event,
+        # so run() can sleep until either controller sends something)
+        midi_wake = threading.Event()
+        self.midi = MidiHandler(debug=midi_debug, wake=midi_wake)
         
         # Secondary MIDI controller for modulation (optional)
         self.modulation_port_pattern = modulation_port_pattern
         self.secondary_midi: Optional[MidiHandler] = None
         if modulation_port_pattern:
-            self.secondary_midi = MidiHandler(port_pattern=modulation_port_pattern, debug=midi_debug)
+            self.secondary_midi = MidiHandler(
+                port_pattern=modulation_port_pattern, debug=midi_debug, wake=midi_wake
+            )
         self.osc: OscSender = MockOscSender(verbose=verbose) if mock_osc else OscSender(broadcast=broadcast)
         self.voices = VoiceTracker()
         self.f1 = F1Modulator()
@@ -161,6 +244,34 @@ class HarmonicBeacon:
             anchor_midi=config.ANCHOR_MIDI_NOTE,
         )
         
+        # Note-on handler for the current mode (re-bound on mode changes)
+        self._select_note_handlers()
+        
+        # CC number -> handler. Listed lowest-priority first so that, if two
+        # features share a CC number, the later (higher-priority) entry wins.
+        self._cc_handlers: dict[int, Callable[[int], None]] = {
+            config.SPLIT_MODE_TOGGLE_CC: self._handle_split_mode_toggle,
+            config.PANIC_NOTE: self._handle_panic_cc,
+            config.STACKING_MODE_CC: self._handle_stacking_mode_toggle,
+            config.STACKING_MIX_CC: self._handle_stacking_mix_change,
+            self.midi.f1_cc: self._handle_f1_change,
+        }
+        self.midi.set_handlers(
+            self._handle_note_on,
+            self._handle_note_off,
+            self._cc_handlers,
+            # Buttons: each press counts even if it sends the same value
+            cc_repeatable=frozenset((config.PANIC_NOTE, config.SPLIT_MODE_TOGGLE_CC)),
+        )
+        
+        # Secondary controller: note-on modulates, its f₁ CC slides f₁,
+        # note-offs and other CCs are ignored
+        if self.secondary_midi is not None:
+            self.secondary_midi.set_handlers(
+                note_on=lambda note, velocity, channel: self._handle_modulation_note(note),
+                cc_handlers={self.secondary_midi.f1_cc: self._handle_f1_change},
+            )
+        
     def start(self) -> None:
         """Start the Harmonic Beacon."""
         # Open primary MIDI port
@@ -209,6 +320,8 @@ class HarmonicBeacon:
         if self.mpe_enabled and self.mpe is not None:
             self.mpe.send_all_notes_off()
         self.voices.clear()
+        for note in list(self._note_lfos):
+            self._release_lfo(note)
             
         # Close connections
         self.midi.close()
@@ -232,6 +345,9 @@ class HarmonicBeacon:
             harmonic_ns=[harmonic_n],
             original_f1=current_f1
         )
+        # The new voice's offsets are relative to the current f₁, so the
+        # next update must not be gated against an older broadcast
+        self._last_sent_f1 = None
         
         if voice_ids:
             vid = voice_ids[0]
@@ -242,10 +358,27 @@ class HarmonicBeacon:
         if self.mpe_enabled and self.mpe is not None and voice_ids:
             self.mpe.send_note_on(voice_ids[0], frequency, vel_norm)
 
+    def _pad_light(self, note: int, color: int, channel: int = 0) -> mido.Message:
+        """Get the (cached) feedback message for a pad light.
+        
+        Args:
+            note: Pad note number
+            color: Feedback color (velocity), 0 turns the light off
+            channel: MIDI channel of the pad
+        """
+        key = (note, color, channel)
+        msg = self._pad_light_msgs.get(key)
+        if msg is None:
+            if color:
+                msg = mido.Message('note_on', note=note, velocity=color, channel=channel)
+            else:
+                msg = mido.Message('note_off', note=note, velocity=0, channel=channel)
+            self._pad_light_msgs[key] = msg
+        return msg
+
     def panic(self) -> None:
         """Kill all active notes and reset state (Panic)."""
-        if self.verbose:
-            print("\n🚨 PANIC! Stopping all notes. 🚨\n")
+        self._log_info("\n🚨 PANIC! Stopping all notes. 🚨\n")
             
         # 1. Stop all tracked voices
         active_notes = list(self.voices.get_active_notes().keys())
@@ -254,48 +387,101 @@ class HarmonicBeacon:
             
         # 2. Force clear everything just in case
         self.voices.clear()
+        for note in list(self._note_lfos):
+            self._release_lfo(note)
         self.osc.send_all_notes_off()
+        self.osc.broadcast_panic()
         if self.mpe_enabled and self.mpe is not None:
-             self.mpe.send_all_notes_off()
+            self.mpe.send_all_notes_off()
              
         # 3. Clear Split Mode Toggles
-        self.toggled_harmonics.clear()
+        self.toggled_harmonics = 0
         
         # 4. Turn off all lights (Launchpad Reset)
         if self.pad_mode_enabled:
-            for n in range(128):
-                self.midi.send_message(mido.Message('note_off', note=n, velocity=0, channel=0))
-        self.voices.clear()
-        self._note_lfos.clear()
-        self.osc.send_all_notes_off()
-        self.osc.broadcast_panic()
-        if self.mpe_enabled and self.mpe is not None:
-            self.mpe.send_all_notes_off()
+            for msg in self._pad_off_msgs:
+                self.midi.send_message(msg)
+
+    def _handle_panic_cc(self, value: int) -> None:
+        """Handle the Panic CC (fires on press, ignores release)."""
+        if value > 0:
+            self.panic()
 
     def _handle_split_mode_toggle(self, value: int) -> None:
         """Handle Split Mode Toggle (CC 104)."""
         if value > 0:
             self.split_mode_enabled = not self.split_mode_enabled
-            if self.verbose:
-                state = "ON" if self.split_mode_enabled else "OFF"
-                print(f"🎛️ Split Mode: {state}")
+            self._select_note_handlers()
+            self._log_info("🎛️ Split Mode: %s", "ON" if self.split_mode_enabled else "OFF")
             
             # Reset state when determining mode
-            self.toggled_harmonics.clear()
+            self.toggled_harmonics = 0
             self.voices.clear()
+            for note in list(self._note_lfos):
+                self._release_lfo(note)
             self.osc.send_all_notes_off()
             if self.mpe:
                 self.mpe.send_all_notes_off()
 
+    def _build_pad_tables(self) -> None:
+        """Precompute the pad note → harmonic mapping for every MIDI note.
+        
+        Fills three 128-entry tables (n = 0 means "not a harmonic pad"):
+        - _pad_n_full: Full Mode harmonic (1-64)
+        - _pad_n_split: Split Mode harmonic (1-32 in each half)
+        - _pad_latch: True for Split Mode upper-half (toggle/latch) pads
+        """
+        self._pad_n_full = [0] * 128
+        self._pad_n_split = [0] * 128
+        self._pad_latch = [False] * 128
+        
+        for note in range(128):
+            rel = note - config.PAD_ANCHOR_NOTE
+            if self._pad_layout == _LAYOUT_LAUNCHPAD:
+                # Launchpad XY Layout (Stride 16)
+                if rel < 0:
+                    continue
+                x = rel % 16
+                y = rel // 16
+                if x >= 8 or y >= 8:
+                    continue
+                # Invert Y so harmonic 1 is at Bottom-Left (Row 0)
+                row_from_bottom = 7 - y
+                # Full Mode: 1-64
+                self._pad_n_full[note] = 1 + x + (row_from_bottom * 8)
+                if row_from_bottom < 4:
+                    # Lower Half (Rows 0-3): Momentary 1-32
+                    self._pad_n_split[note] = 1 + x + (row_from_bottom * 8)
+                else:
+                    # Upper Half (Rows 4-7): Toggle 1-32
+                    self._pad_n_split[note] = 1 + x + ((row_from_bottom - 4) * 8)
+                    self._pad_latch[note] = True
+            else:
+                # Linear Mapping (Force/Generic), Split Mode does not apply
+                self._pad_n_full[note] = 1 + rel
+                self._pad_n_split[note] = 1 + rel
+    
+    def _select_note_handlers(self) -> None:
+        """Bind the note-on handler for the current mode.
+        
+        Called at init and whenever Pad Mode or Split Mode is toggled, so
+        each note-on only runs the branch for the active mode.
+        """
+        if not self.pad_mode_enabled:
+            self._note_on_impl = self._note_on_keyboard
+        elif self.split_mode_enabled:
+            self._note_on_impl = self._note_on_pad_split
+        else:
+            self._note_on_impl = self._note_on_pad_full
+
     def _handle_note_on(self, note: int, velocity: int, channel: int = 0) -> None:
-        """Handle a Note-On event with tolerance-based harmonic mapping.
+        """Handle a Note-On event.
         
-        Supports two modes:
+        Handles the Panic and Pad Mode toggle notes, then dispatches to the
+        handler bound for the current mode:
         1. Pad Mode: Direct mapping of 64 pads to harmonics 1-64.
-        2. Keyboard Mode: Standard tolerance-based mapping with Atmosphere/Natural layers.
+        2. Keyboard Mode: Optimized Chromatic mapping with Stacking.
         """
-        current_f1 = self.f1.value
-        
         # --- Check for Panic ---
         if note == config.PANIC_NOTE:
             self.panic()
@@ -304,125 +490,95 @@ class HarmonicBeacon:
         # --- Check for Mode Toggle ---
         if note == config.PAD_MODE_TOGGLE_NOTE:
             self.pad_mode_enabled = not self.pad_mode_enabled
-            if self.verbose:
-                state = "PAD MODE" if self.pad_mode_enabled else "KEYBOARD MODE"
-                print(f"\n🎛️ Switched to: {state}\n")
+            self._select_note_handlers()
+            self._log_info(
+                "\n🎛️ Switched to: %s\n",
+                "PAD MODE" if self.pad_mode_enabled else "KEYBOARD MODE",
+            )
             
             # Broadcast state to visualizer
             self.osc.broadcast_pad_mode(self.pad_mode_enabled)
             
             # Don't play sound for the toggle button
             return
+        
+        self._note_on_impl(note, velocity, channel)
 
-        # =========================================================================
-        # MODE 1: PAD MODE (Direct Harmonic Mapping)
-        # =========================================================================
-        if self.pad_mode_enabled:
-            # Determine Mapping
-            layout = getattr(config, 'PAD_MAP_TYPE', 'LINEAR')
-            n = 0
-            is_toggle_action = False
-            feedback_color = config.PAD_FEEDBACK_COLOR_ON
-            
-            if layout == 'LAUNCHPAD':
-                # Launchpad XY Layout (Stride 16)
-                rel = note - config.PAD_ANCHOR_NOTE
-                if rel >= 0:
-                    x = rel % 16
-                    y = rel // 16
-                    if x < 8 and y < 8:
-                        # Invert Y so harmonic 1 is at Bottom-Left (Row 0)
-                        row_from_bottom = 7 - y
-                        
-                        if self.split_mode_enabled:
-                             if row_from_bottom < 4:
-                                 # Lower Half (Rows 0-3): Momentary 1-32
-                                 n = 1 + x + (row_from_bottom * 8)
-                             else:
-                                 # Upper Half (Rows 4-7): Toggle 1-32
-                                 n = 1 + x + ((row_from_bottom - 4) * 8)
-                                 is_toggle_action = True
-                                 feedback_color = getattr(config, 'PAD_FEEDBACK_COLOR_TOGGLE_ON', 21)
-                        else:
-                             # Full Mode: 1-64
-                             n = 1 + x + (row_from_bottom * 8)
-            else:
-                # Linear Mapping (Force/Generic)
-                n = 1 + (note - config.PAD_ANCHOR_NOTE)
-            
-            # Validity check
-            if 1 <= n <= 64:
-                # --- Toggle Logic ---
-                if is_toggle_action:
-                    if n in self.toggled_harmonics:
-                        # Turn OFF Logic
-                        self.toggled_harmonics.discard(n)
-                        if self.verbose:
-                            print(f"🎛️ Pad {note}: Toggle OFF (n={n})")
-                        
-                        # Kill triggers
-                        pair = self.voices.note_off(note)
-                        if pair:
-                            self._note_lfos.pop(note, None)
-                            for i, voice_id in enumerate(pair.voice_ids):
-                                freq = pair.frequencies[i] if i < len(pair.frequencies) else 0.0
-                                self.osc.send_note_off(voice_id, frequency=freq)
-                                self.osc.broadcast_voice_off(voice_id)
-                            self.osc.broadcast_key_off(note)
-                            if self.mpe_enabled and self.mpe:
-                                for i, voice_id in enumerate(pair.voice_ids):
-                                    freq = pair.frequencies[i] if i < len(pair.frequencies) else 0.0
-                                    self.mpe.send_note_off(voice_id, frequency=freq)
-                                    
-                        # Turn off light
-                        self.midi.send_message(mido.Message('note_off', note=note, velocity=0, channel=channel))
-                        return
-                    else:
-                        # Turn ON Logic
-                        self.toggled_harmonics.add(n)
-                        if self.verbose:
-                             print(f"🎛️ Pad {note}: Toggle ON (n={n})")
-                        # Fall through to Play Logic
-                
-                # --- Play Logic ---
-                # Direct harmonic mapping
-                self._play_harmonic(note, n, velocity, channel)
-                if self.verbose and not is_toggle_action:
-                    print(f"🎛️ Pad {note}: Harmonic {n} ({n*current_f1:.1f} Hz)")
-                
-                # Feedback: Light up the pad
-                self.midi.send_message(mido.Message(
-                    'note_on', 
-                    note=note, 
-                    velocity=feedback_color,
-                    channel=channel
-                ))
-            else:
-                if self.verbose:
-                    print(f"🎛️ Pad {note}: Ignored (n={n})")
+    # =========================================================================
+    # MODE 1: PAD MODE (Direct Harmonic Mapping)
+    # =========================================================================
+    
+    def _note_on_pad_full(self, note: int, velocity: int, channel: int = 0) -> None:
+        """Pad Mode note-on, Full Mode (every pad momentary)."""
+        self._pad_note_on(note, velocity, channel, self._pad_n_full[note], False)
+        
+    def _note_on_pad_split(self, note: int, velocity: int, channel: int = 0) -> None:
+        """Pad Mode note-on, Split Mode (upper half latches)."""
+        self._pad_note_on(
+            note, velocity, channel, self._pad_n_split[note], self._pad_latch[note]
+        )
+    
+    def _pad_note_on(
+        self,
+        note: int,
+        velocity: int,
+        channel: int,
+        n: int,
+        is_toggle_action: bool,
+    ) -> None:
+        """Play (or toggle) the harmonic mapped to a pad."""
+        # Validity check
+        if not 1 <= n <= 64:
+            self._log_info("🎛️ Pad %d: Ignored (n=%d)", note, n)
             return
         
-        # =========================================================================
-        # MODE 2: KEYBOARD MODE (Optimized Chromatic + Stacking)
-        # =========================================================================
+        feedback_color = self._pad_feedback_on
+        
+        # --- Toggle Logic ---
+        if is_toggle_action:
+            feedback_color = self._pad_feedback_toggle
+            if self.toggled_harmonics & (1 << n):
+                # Turn OFF Logic
+                self.toggled_harmonics &= ~(1 << n)
+                self._log_info("🎛️ Pad %d: Toggle OFF (n=%d)", note, n)
+                
+                # Kill triggers
+                self._teardown_voice(note)
+                            
+                # Turn off light
+                self.midi.send_message(self._pad_light(note, 0, channel))
+                return
+            else:
+                # Turn ON Logic
+                self.toggled_harmonics |= 1 << n
+                self._log_info("🎛️ Pad %d: Toggle ON (n=%d)", note, n)
+                # Fall through to Play Logic
+        
+        # --- Play Logic ---
+        # Direct harmonic mapping
+        self._play_harmonic(note, n, velocity, channel)
+        if not is_toggle_action:
+            self._log_info("🎛️ Pad %d: Harmonic %d (%.1f Hz)", note, n, n * self.f1.value)
+        
+        # Feedback: Light up the pad
+        self.midi.send_message(self._pad_light(note, feedback_color, channel))
+        
+    # =========================================================================
+    # MODE 2: KEYBOARD MODE (Optimized Chromatic + Stacking)
+    # =========================================================================
+    
+    def _note_on_keyboard(self, note: int, velocity: int, channel: int = 0) -> None:
+        """Keyboard Mode note-on (Optimized Chromatic + Stacking)."""
+        current_f1 = self.f1.value
         
         # --- 1. Get Match ---
         match = self._key_mapper.get_match(note)
         if match is None:
-            if self.verbose:
-                 print(f"♪ Note ON: MIDI {note} → (no match)")
+            self._log_info("♪ Note ON: MIDI %d → (no match)", note)
             return
 
         # --- 2. Determine Voices ---
-        frequencies: list[float] = []
-        harmonic_ns: list[int] = []
-        target_gains: list[float] = []
-        
-        # Helper to add voice
-        def add_voice(freq, n, gain):
-            frequencies.append(freq)
-            harmonic_ns.append(n)
-            target_gains.append(gain)
+        # Parallel lists (frequency, harmonic n, gain), built directly per branch
 
         # Mix calculation (0.0 = Natural, 1.0 = Transposed)
         # Config: 0=Natural, 127=Transposed
@@ -431,33 +587,42 @@ class HarmonicBeacon:
         if self.stacking_mode_enabled and match.is_transposed:
              # Stacked Mode: Play both
              # Voice 1: Primary (Transposed) - Controlled by Mix
-             add_voice(match.primary_freq, match.primary_n, mix)
-             
              # Voice 2: Secondary (Natural) - Controlled by Inverse Mix
-             add_voice(match.secondary_freq, match.secondary_n, 1.0 - mix)
+             frequencies = [match.primary_freq, match.secondary_freq]
+             harmonic_ns = [match.primary_n, match.secondary_n]
+             target_gains = [mix, 1.0 - mix]
              
-             if self.verbose:
-                 print(f"♪ Note ON: MIDI {note} [STACKED]")
-                 print(f"    Primary: {match.primary_freq:.1f}Hz (Mix={mix:.2f})")
-                 print(f"    Natural: {match.secondary_freq:.1f}Hz (n={match.secondary_n}) (Mix={1.0-mix:.2f})")
+             self._log_info(
+                 "♪ Note ON: MIDI %d [STACKED]\n"
+                 "    Primary: %.1fHz (Mix=%.2f)\n"
+                 "    Natural: %.1fHz (n=%d) (Mix=%.2f)",
+                 note, match.primary_freq, mix,
+                 match.secondary_freq, match.secondary_n, 1.0 - mix,
+             )
                  
         else:
              # Single Voice (Best Fit)
              # If not transposed, it's a local match, so it's both "Natural" and "Best".
              # We play it at full volume.
-             add_voice(match.primary_freq, match.primary_n, 1.0)
+             frequencies = [match.primary_freq]
+             harmonic_ns = [match.primary_n]
+             target_gains = [1.0]
              
-             if self.verbose:
-                 sign = '+' if match.primary_deviation >= 0 else ''
-                 src = "Prototype" if match.source_type == 'prototype' else "Local"
-                 print(f"♪ Note ON: MIDI {note} → {match.primary_freq:.1f}Hz ({sign}{match.primary_deviation:.1f}¢) [{src}]")
+             self._log_info(
+                 "♪ Note ON: MIDI %d → %.1fHz (%+.1f¢) [%s]",
+                 note, match.primary_freq, match.primary_deviation,
+                 "Prototype" if match.source_type == 'prototype' else "Local",
+             )
 
         # --- 3. Allocate Voices ---
         
         # LFO per note
-        lfo = HarmonicLFO(rate=config.DEFAULT_LFO_RATE, mode=VibratoMode.SMOOTH)
-        lfo.set_harmonics(frequencies)
+        self._release_lfo(note)
+        lfo = self._lfo_pool.pop() if self._lfo_pool else HarmonicLFO()
+        lfo.reset(config.DEFAULT_LFO_RATE, VibratoMode.SMOOTH, frequencies)
         self._note_lfos[note] = lfo
+        if len(frequencies) > 1:
+            self._active_chorus_notes.add(note)
         
         # Tracker
         voice_ids = self.voices.note_on(
@@ -466,60 +631,82 @@ class HarmonicBeacon:
             harmonic_ns=harmonic_ns,
             original_f1=current_f1,
         )
+        # New voices are relative to the current f₁: don't gate the next
+        # update against an f₁ broadcast before they started
+        self._last_sent_f1 = None
             
-        # --- 4. Send to OSC ---
+        # --- 4. Send to OSC (one bundle for the whole chord) ---
         vel_norm = velocity / 127.0
+        records = []
         for i, voice_id in enumerate(voice_ids):
-            freq = frequencies[i]
-            n = harmonic_ns[i] 
-            gain = target_gains[i]
-            
-            final_vel = vel_norm * gain
+            final_vel = vel_norm * target_gains[i]
             if final_vel > 0.001:
-                self.osc.send_note_on(voice_id, freq, final_vel)
-                self.osc.broadcast_voice_on(voice_id, freq, final_vel, note, n)
+                records.append((voice_id, frequencies[i], final_vel, note, harmonic_ns[i]))
+        self.osc.send_voice_on_bulk(records)
         
         # Broadcast key
         self.osc.broadcast_key_on(note, velocity)
         
         # --- 5. Send to MPE ---
         if self.mpe_enabled and self.mpe is not None:
-             for i, voice_id in enumerate(voice_ids):
-                 freq = frequencies[i]
-                 gain = target_gains[i]
-                 final_vel = vel_norm * gain
-                 if final_vel > 0.001:
-                     self.mpe.send_note_on(voice_id, freq, final_vel)
+             for voice_id, freq, final_vel, _, _ in records:
+                 self.mpe.send_note_on(voice_id, freq, final_vel)
 
 
             
+    def _release_lfo(self, note: int) -> None:
+        """Detach a note's LFO (if any) and return it to the pool."""
+        self._active_chorus_notes.discard(note)
+        lfo = self._note_lfos.pop(note, None)
+        if lfo is not None and len(self._lfo_pool) < _LFO_POOL_MAX:
+            self._lfo_pool.append(lfo)
+            
+    def _teardown_voice(self, note: int) -> Optional[VoicePair]:
+        """Release a note's voices on OSC/MPE and drop its LFO.
+        
+        Shared by the pad toggle-off, pad note-off and keyboard note-off paths.
+        
+        Args:
+            note: MIDI note number to release
+            
+        Returns:
+            The released VoicePair, or None if the note was not active
+        """
+        # Clean up LFO for this note (even if its voices were already cleared)
+        self._release_lfo(note)
+        
+        pair = self.voices.note_off(note)
+        if pair is None:
+            return None
+        
+        osc = self.osc
+        mpe = self.mpe if self.mpe_enabled else None
+        frequencies = pair.frequencies
+        freq_count = len(frequencies)
+        
+        # === Send to OSC (and MPE) ===
+        for i, voice_id in enumerate(pair.voice_ids):
+            freq = frequencies[i] if i < freq_count else 0.0
+            osc.send_note_off(voice_id, frequency=freq)
+            osc.broadcast_voice_off(voice_id)
+            if mpe is not None:
+                mpe.send_note_off(voice_id, frequency=freq)
+        
+        # Broadcast key off
+        osc.broadcast_key_off(note)
+        return pair
+            
     def _handle_note_off(self, note: int, channel: int = 0) -> None:
         """Handle Note-Off event."""
         # Pad Mode Logic
         if self.pad_mode_enabled:
             # Map pad to harmonic
-            layout = getattr(config, 'PAD_MAP_TYPE', 'LINEAR')
-            n = 0
-            is_upper_half = False
-            
-            if layout == 'LAUNCHPAD':
-                rel = note - config.PAD_ANCHOR_NOTE
-                if rel >= 0:
-                    x = rel % 16
-                    y = rel // 16
-                    if x < 8 and y < 8:
-                        # Invert Y so harmonic 1 is at Bottom-Left
-                        row_from_bottom = 7 - y
-                        if self.split_mode_enabled:
-                            if row_from_bottom < 4:
-                                n = 1 + x + (row_from_bottom * 8)
-                            else:
-                                n = 1 + x + ((row_from_bottom - 4) * 8)
-                                is_upper_half = True
-                        else:
-                             n = 1 + x + (row_from_bottom * 8)
+            if self.split_mode_enabled:
+                n = self._pad_n_split[note]
+                is_upper_half = self._pad_latch[note]
             else:
-                n = 1 + (note - config.PAD_ANCHOR_NOTE)
+                n = self._pad_n_full[note]
+                is_upper_half = False
             
             # If Split Mode Upper Half (Latching), IGNORE Note Off
             if is_upper_half:
@@ -528,67 +715,28 @@ class HarmonicBeacon:
             # If it was a valid harmonic pad, turn off its voice
             if 1 <= n <= 64:
                 # Turn off pad light (Mirror channel) - ONLY if not latched
-                self.midi.send_message(mido.Message('note_off', note=note, velocity=0, channel=channel))
+                self.midi.send_message(self._pad_light(note, 0, channel))
                 
-                pair = self.voices.note_off(note)
+                pair = self._teardown_voice(note)
                 if pair is None:
                     return # No voice was active for this note
                 
-                # Clean up LFO for this note
-                self._note_lfos.pop(note, None)
-                
-                # === Send to OSC ===
-                for i, voice_id in enumerate(pair.voice_ids):
-                    freq = pair.frequencies[i] if i < len(pair.frequencies) else 0.0
-                    self.osc.send_note_off(voice_id, frequency=freq)
-                    self.osc.broadcast_voice_off(voice_id)
-                
-                # Broadcast key off
-                self.osc.broadcast_key_off(note)
-                
-                # === Send to MPE ===
-                if self.mpe_enabled and self.mpe is not None:
-                    for i, voice_id in enumerate(pair.voice_ids):
-                        freq = pair.frequencies[i] if i < len(pair.frequencies) else 0.0
-                        self.mpe.send_note_off(voice_id, frequency=freq)
-                
-                if self.verbose:
-                    print(f"♫ Pad OFF: MIDI {note} ({len(pair.voice_ids)} voices)")
+                self._log_info("♫ Pad OFF: MIDI %d (%d voices)", note, len(pair.voice_ids))
             return # Handled pad mode note off
         
         # Keyboard Mode Logic
-        pair = self.voices.note_off(note)
+        pair = self._teardown_voice(note)
         if pair is None:
             return
         
-        # Clean up LFO for this note
-        self._note_lfos.pop(note, None)
-        
-        # === Send to OSC ===
-        for i, voice_id in enumerate(pair.voice_ids):
-            freq = pair.frequencies[i] if i < len(pair.frequencies) else 0.0
-            self.osc.send_note_off(voice_id, frequency=freq)
-            self.osc.broadcast_voice_off(voice_id)
-        
-        # Broadcast key off
-        self.osc.broadcast_key_off(note)
-        
-        # === Send to MPE ===
-        if self.mpe_enabled and self.mpe is not None:
-            for i, voice_id in enumerate(pair.voice_ids):
-                freq = pair.frequencies[i] if i < len(pair.frequencies) else 0.0
-                self.mpe.send_note_off(voice_id, frequency=freq)
-        
-        if self.verbose:
-            print(f"♫ Note OFF: MIDI {note} ({len(pair.voice_ids)} voices)")
+        self._log_info("♫ Note OFF: MIDI %d (%d voices)", note, len(pair.voice_ids))
             
     def _handle_f1_change(self, cc_value: int) -> None:
         """Handle f₁ modulation CC."""
         self.f1.set_target_from_cc(cc_value)
         self.osc.broadcast_f1(self.f1.target)
         self.osc.broadcast_cc(config.F1_CC_NUMBER, cc_value)
-        if self.verbose:
-            print(f"⟳ f₁ target: {self.f1.target:.1f} Hz")
+        self._log_info("⟳ f₁ target: %.1f Hz", self.f1.target)
             
     def _update_active_voices(self) -> None:
         """Update all active voices with current f₁ using pitch expressions.
@@ -596,31 +744,41 @@ class HarmonicBeacon:
         Calculates the semitone offset from each note's original pitch
         and sends Surge XT pitch expressions for real-time sliding.
         """
+        # Nothing held, or f₁ within the update threshold of the last
+        # broadcast (compared as a ratio, no log2): nothing to do
+        if not self.voices.active_count:
+            return
         current_f1 = self.f1.value
+        last_f1 = self._last_sent_f1
+        if last_f1 is not None and last_f1 / _F1_UPDATE_RATIO < current_f1 < last_f1 * _F1_UPDATE_RATIO:
+            return
+        self._last_sent_f1 = current_f1
         
-        for note, pair in self.voices.get_active_notes().items():
-            # Iterate through all voices for this note
-            for i, voice_id in enumerate(pair.voice_ids):
-                if i >= len(pair.frequencies) or i >= len(pair.harmonic_ns):
-                    continue
-                    
-                original_freq = pair.frequencies[i]
-                harmonic_n = pair.harmonic_ns[i]
-                
-                # Calculate new frequency based on current f₁
-                new_freq = current_f1 * harmonic_n
+        mpe = self.mpe if self.mpe_enabled else None
+        updates: list[tuple[int, float]] = []
+        
+        # midi(n × f₁) - midi(orig) == midi(f₁) - midi(orig / n): one log2
+        # per update, then a subtraction against each voice's cached f₁ MIDI
+        f1_midi = frequency_to_midi_float(current_f1)
+        for note, pair in self.voices.iter_active():
+            for i, (voice_id, voice_f1_midi) in enumerate(zip(pair.voice_ids, pair.f1_midis)):
+                semitone_offset = f1_midi - voice_f1_midi
                 
-                # Calculate semitone offset from original frequency
-                original_midi = frequency_to_midi_float(original_freq)
-                new_midi = frequency_to_midi_float(new_freq)
-                semitone_offset = new_midi - original_midi
+                # All voices of a note move by the same f₁ ratio, so the
+                # primary voice tells whether this note changed since last send
+                if i == 0:
+                    if abs(semitone_offset - pair.last_offset) < 0.001:
+                        break
+                    pair.last_offset = semitone_offset
                 
-                # === Send to OSC ===
-                self.osc.send_pitch_expression(voice_id, semitone_offset)
+                # === Queue for OSC (one bundle per update) ===
+                updates.append((voice_id, semitone_offset))
                 
                 # === Send to MPE ===
-                if self.mpe_enabled and self.mpe is not None:
-                    self.mpe.send_pitch_expression(voice_id, semitone_offset)
+                if mpe is not None:
+                    mpe.send_pitch_expression(voice_id, semitone_offset)
+        
+        self.osc.send_pitch_expression_bulk(updates)
     
     def _handle_modulation_note(self, note: int) -> None:
         """Handle note from secondary controller - modulate to new root.
@@ -649,37 +807,46 @@ class HarmonicBeacon:
         # Find the harmonic n at that semitone distance
         target_cents = semitones_from_new_anchor * 100.0
         
-        # Find closest harmonic to target_cents
-        best_n = 1
-        best_diff = float('inf')
-        for n in range(1, config.MAX_HARMONIC + 1):
-            h_cents = 1200.0 * math.log2(n)
-            diff = abs(h_cents - target_cents)
-            if diff < best_diff:
-                best_diff = diff
-                best_n = n
-            if h_cents > target_cents + 100:  # Stop if way past
-                break
+        # Find closest harmonic to target_cents. HARMONIC_CENTS is sorted, so
+        # bisect; consecutive modulation notes tend to land near the last
+        # match, so try a small window around it before the full table.
+        cents = HARMONIC_CENTS
+        size = len(cents)
+        last = self._last_harmonic_idx
+        lo = max(0, last - 2)
+        hi = min(size, last + 4)
+        if not cents[lo] <= target_cents <= cents[hi - 1]:
+            lo, hi = 0, size
+        idx = bisect.bisect_left(cents, target_cents, lo, hi)
+        if idx == size or (idx > 0 and target_cents - cents[idx - 1] <= cents[idx] - target_cents):
+            idx -= 1  # Lower neighbour is closer (ties go low)
+        self._last_harmonic_idx = idx
+        best_n = idx + 1
         
         # Calculate new f1 so the played note becomes n=best_n at 12TET frequency
         # For the played MIDI note, calculate its 12TET frequency
-        from .harmonics import FREQ_A4, MIDI_A4
-        played_freq = FREQ_A4 * (2.0 ** ((note - MIDI_A4) / 12.0))
+        played_freq = get_standard_frequency(note)
         
         # new_f1 = played_freq / best_n
         new_f1 = played_freq / best_n
         
-        # Transpose to allowed range (preserve pitch class)
-        while new_f1 < self.f1.min_freq:
-            new_f1 *= 2.0
-            new_anchor += 12  # Move anchor up an octave too
-        while new_f1 > self.f1.max_freq:
-            new_f1 /= 2.0
-            new_anchor -= 12  # Move anchor down an octave too
+        # Transpose to allowed range (preserve pitch class), shifting by the
+        # whole number of octaves needed in one step; the anchor moves with it
+        min_freq = self.f1.min_freq
+        max_freq = self.f1.max_freq
+        if new_f1 < min_freq:
+            octaves = math.ceil(math.log2(min_freq / new_f1))
+            new_f1 = math.ldexp(new_f1, octaves)
+            new_anchor += 12 * octaves
+        if new_f1 > max_freq:
+            octaves = math.ceil(math.log2(new_f1 / max_freq))
+            new_f1 = math.ldexp(new_f1, -octaves)
+            new_anchor -= 12 * octaves
         
         # Set f₁ instantly (no sliding)
         self.f1.value = new_f1
         self.f1.target = new_f1
+        self.f1.is_stable = True
         
         # Update the key mapper with new anchor and f1
         self._key_mapper.rebuild(f1=new_f1, anchor_midi=new_anchor)
@@ -694,13 +861,10 @@ class HarmonicBeacon:
         self.osc.broadcast_f1(new_f1)
         self.osc.broadcast_anchor(new_anchor)
         
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        anchor_note = note_names[new_anchor % 12]
-        anchor_octave_num = (new_anchor // 12) - 1
-        
-        if self.verbose:
-            print(f"⚓ Modulated: {anchor_note}{anchor_octave_num} is now n=1, f₁ = {new_f1:.1f} Hz")
-            print(f"    (from MIDI {note}, n={best_n})")
+        self._log_info(
+            "⚓ Modulated: %s%d is now n=1, f₁ = %.1f Hz\n    (from MIDI %d, n=%d)",
+            _NOTE_NAMES[new_anchor % 12], (new_anchor // 12) - 1, new_f1, note, best_n,
+        )
     
     def _handle_stacking_mix_change(self, cc_value: int) -> None:
         """Handle Stacking Mix CC change (CC67).
@@ -711,10 +875,7 @@ class HarmonicBeacon:
         127 = Transposed Layer Focused
         """
         self.stacking_mix = cc_value
-        if self.verbose:
-             # Calculate percentage
-             pct = int((cc_value / 127.0) * 100)
-             print(f"🎛️ Stacking Mix: {pct}%")
+        self._log_info("🎛️ Stacking Mix: %d%%", int((cc_value / 127.0) * 100))
 
     def _handle_stacking_mode_toggle(self, cc_value: int) -> None:
          """Handle Stacking Mode Toggle (CC22).
@@ -724,22 +885,26 @@ class HarmonicBeacon:
          new_state = cc_value >= 64
          if new_state != self.stacking_mode_enabled:
              self.stacking_mode_enabled = new_state
-             if self.verbose:
-                 state = "ON [Stacked]" if self.stacking_mode_enabled else "OFF [Single]"
-                 print(f"🎛️ Stacking Mode: {state}")
+             self._log_info(
+                 "🎛️ Stacking Mode: %s",
+                 "ON [Stacked]" if self.stacking_mode_enabled else "OFF [Single]",
+             )
 
     
     def _update_lfo_chorus(self, dt: float) -> None:
-        """Update LFO chorus for all active notes.
+        """Update LFO chorus for notes sweeping more than one harmonic.
         
         Args:
             dt: Time delta since last update in seconds
         """
-        for note, lfo in self._note_lfos.items():
-            if lfo.harmonic_count <= 1:
-                continue  # No chorus needed for single harmonic
-            
-            pair = self.voices.get_active_notes().get(note)
+        pitch_updates: list[tuple[int, float]] = []
+        freq_updates: list[tuple[int, float]] = []
+        get_voice_pair = self.voices.get_voice_pair
+        note_lfos = self._note_lfos
+        # Single-harmonic notes need no chorus and are never in this set
+        for note in self._active_chorus_notes:
+            lfo = note_lfos[note]
+            pair = get_voice_pair(note)
             if pair is None:
                 continue
             
@@ -747,76 +912,70 @@ class HarmonicBeacon:
             current_freq = lfo.update(dt)
             
             # Calculate pitch offset from original beacon frequency
-            original_midi = frequency_to_midi_float(pair.beacon_frequency)
             current_midi = frequency_to_midi_float(current_freq)
-            semitone_offset = current_midi - original_midi
+            semitone_offset = current_midi - pair.beacon_midi
             
-            # Send pitch expression
-            self.osc.send_pitch_expression(pair.beacon_voice_id, semitone_offset)
-            
-            # Broadcast frequency update for visualizer
-            self.osc.broadcast_voice_freq(pair.beacon_voice_id, current_freq)
+            # Queue pitch expression and visualizer frequency update
+            voice_id = pair.beacon_voice_id
+            pitch_updates.append((voice_id, semitone_offset))
+            freq_updates.append((voice_id, current_freq))
+        
+        # One bundle per destination for the whole frame
+        self.osc.send_pitch_expression_bulk(pitch_updates)
+        self.osc.broadcast_voice_freq_bulk(freq_updates)
             
     def run(self) -> None:
         """Run the main event loop."""
         self.start()
-        self._last_update_time = time.time()
+        self._last_update_time = time.monotonic_ns()
+        
+        # Bind everything the loop touches once (start() has settled the ports)
+        f1 = self.f1
+        voices = self.voices
+        chorus_notes = self._active_chorus_notes
+        update_active_voices = self._update_active_voices
+        update_lfo_chorus = self._update_lfo_chorus
+        midi = self.midi
+        midi_dispatch = midi.dispatch
+        midi_wait = midi.wait
+        secondary = self.secondary_midi
+        monotonic_ns = time.monotonic_ns
+        idle_timeout = config.MIDI_IDLE_TIMEOUT
+        poll_interval = config.MIDI_POLL_INTERVAL
         
         try:
             while self.running:
-                current_time = time.time()
-                dt = current_time - self._last_update_time
+                # Monotonic clock: immune to wall-clock jumps that would
+                # corrupt LFO phase; integer ns until the final scale
+                current_time = monotonic_ns()
+                dt = (current_time - self._last_update_time) * 1e-9
                 self._last_update_time = current_time
                 
                 # Update f₁ interpolation
-                f1_changed = self.f1.update()
+                f1_changed = f1.update()
                 
                 # If f₁ changed, update all active voices
-                if f1_changed and self.voices.active_count > 0:
-                    self._update_active_voices()
+                if f1_changed and voices.active_count > 0:
+                    update_active_voices()
                 
                 # Update LFO chorus for harmonic sweep
-                if self._note_lfos:
-                    self._update_lfo_chorus(dt)
+                if chorus_notes:
+                    update_lfo_chorus(dt)
                 
-                # Process MIDI messages
-                for msg in self.midi.poll():
-                    if self.midi.is_note_on(msg):
-                        self._handle_note_on(msg.note, msg.velocity, msg.channel)
-                        
-                    elif self.midi.is_note_off(msg):
-                        self._handle_note_off(msg.note, msg.channel)
-                        
-                    elif self.midi.is_f1_control(msg):
-                        self._handle_f1_change(msg.value)
-                    
-                    elif self.midi.is_stacking_mix_control(msg):
-                        self._handle_stacking_mix_change(msg.value)
-                    
-                    elif self.midi.is_stacking_mode_toggle(msg):
-                        self._handle_stacking_mode_toggle(msg.value)
-
-                    elif self.midi.is_panic_cc(msg) and msg.value > 0:
-                        self.panic()
-
-                    elif self.midi.is_split_mode_toggle(msg):
-                        self._handle_split_mode_toggle(msg.value)
-
+                # Process MIDI messages (routed by the handlers set in __init__)
+                midi_dispatch()
                 
-                # Poll secondary controller for modulation notes
-                if self.secondary_midi is not None:
-                    for msg in self.secondary_midi.poll():
-                        if self.secondary_midi.is_note_on(msg):
-                            # Modulation note - change anchor without producing sound
-                            self._handle_modulation_note(msg.note)
-                        
-                        elif self.secondary_midi.is_f1_control(msg):
-                            self._handle_f1_change(msg.value)
-                            
-                        # Note-off from secondary controller is ignored
+                # Secondary controller: modulation notes and f₁ CC
+                if secondary is not None:
+                    secondary.dispatch()
                 
-                # Sleep to avoid busy-waiting
-                time.sleep(config.MIDI_POLL_INTERVAL)
+                # Sleep until MIDI arrives. While f₁ is sliding or a chorus
+                # is sweeping, wake at the poll interval to keep animating;
+                # otherwise there is nothing to do but wait for input.
+                if f1.is_stable and not chorus_notes:
+                    midi_wait(idle_timeout)
+                else:
+                    midi_wait(poll_interval)
                 
         except KeyboardInterrupt:
             pass
@@ -824,8 +983,24 @@ class HarmonicBeacon:
             self.stop()
 
 
+def _print_ports() -> None:
+    """Print available MIDI input ports (for --list-ports)."""
+    ports = MidiHandler.list_ports()
+    print("Available MIDI input ports:")
+    for i, port in enumerate(ports):
+        print(f"  [{i}] {port}")
+    if not ports:
+        print("  (none)")
+
+
 def main() -> None:
     """Entry point for the Harmonic Beacon CLI."""
+    # Fast path for the diagnostic `--list-ports` on its own: skip building
+    # the argument parser entirely
+    if sys.argv[1:] == ["--list-ports"]:
+        _print_ports()
+        return
+    
     parser = argparse.ArgumentParser(
         description="The Harmonic Beacon - Natural Harmonic Series MIDI Middleware"
     )
@@ -885,14 +1060,19 @@ def main() -> None:
     
     args = parser.parse_args()
     
+    # Per-event status messages (note on/off, CC changes) are logged at INFO
+    # on the package logger; the root logger (and third-party libraries'
+    # INFO output) is left alone
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    package_log = logging.getLogger("harmonic_beacon")
+    package_log.addHandler(handler)
+    package_log.setLevel(logging.WARNING if args.quiet else logging.INFO)
+    package_log.propagate = False
+    
     # List ports mode
     if args.list_ports:
-        ports = MidiHandler.list_ports()
-        print("Available MIDI input ports:")
-        for i, port in enumerate(ports):
-            print(f"  [{i}] {port}")
-        if not ports:
-            print("  (none)")
+        _print_ports()
         return
     
     # Determine modulation port
@@ -4,14 +4,88 @@ Handles MIDI input from the controller (KeyLab 61 MkII) and
 dispatches Note-On/Off and CC messages.
 """
 
+import queue
+import sys
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 import mido
 
 from . import config
 
+# Capacity of the receive ring (oldest messages are dropped on overflow)
+RX_QUEUE_SIZE = 4096
+
+# Capacity of the outgoing FIFO; when a stalled output lets it fill, the
+# oldest queued message is dropped
+TX_QUEUE_SIZE = 1024
+
+# --midi-debug trace: capacity of the in-memory buffer and how often the
+# writer thread flushes it (keeps console I/O off the MIDI paths)
+DEBUG_LOG_SIZE = 8192
+DEBUG_FLUSH_INTERVAL = 0.1
+
+# Message types the beacon never uses; dropped in the input callback so they
+# neither fill the receive ring nor wake the main loop (MIDI clock alone is
+# 24 messages per quarter note)
+DROPPED_MESSAGE_TYPES = frozenset({
+    "clock", "active_sensing", "sysex", "start", "stop", "continue",
+    "songpos", "song_select", "quarter_frame", "tune_request", "reset",
+})
+
+# Case-folded substrings of port names never opened as inputs: system
+# passthrough and other rtmidi clients would feed our own output back
+LOOPBACK_PORT_MARKERS = ("midi through", "rtmidi")
+
+# How long (seconds) an input/output port enumeration is reused. Each
+# enumeration is a round-trip to the MIDI backend; handlers opened together
+# (primary + modulation controller) share one.
+PORT_NAMES_TTL = 1.0
+
+# Errors a port open can raise: mido raises OSError/IOError for unknown or
+# busy ports, rtmidi's errors derive from RuntimeError, SystemError or
+# ValueError. Anything else is a bug and should propagate.
+_PORT_OPEN_ERRORS = (OSError, RuntimeError, SystemError, ValueError)
+
+# Returned by poll() when nothing is pending (no generator to create)
+_EMPTY: tuple = ()
+
+# Size of the per-(channel, CC) last-value table: 16 channels x 128 CCs
+_CC_SLOTS = 16 * 128
+
+# Identical send errors are printed at most once per this many seconds
+SEND_ERROR_REPEAT_INTERVAL = 5.0
+
+# How long close() waits (seconds) for ports closing in parallel
+PORT_CLOSE_TIMEOUT = 1.0
+
+_port_names_cache: dict[str, tuple[float, tuple[str, ...]]] = {}
+
+
+def _cached_port_names(kind: str, enumerate_ports: Callable[[], list[str]]) -> tuple[str, ...]:
+    """Return port names of one kind ("input"/"output"), cached for PORT_NAMES_TTL."""
+    now = time.monotonic()
+    cached = _port_names_cache.get(kind)
+    if cached is not None and now - cached[0] < PORT_NAMES_TTL:
+        return cached[1]
+    names = tuple(enumerate_ports())
+    _port_names_cache[kind] = (now, names)
+    return names
+
+
+def get_input_names() -> tuple[str, ...]:
+    """Available MIDI input port names (briefly cached)."""
+    return _cached_port_names("input", mido.get_input_names)
+
+
+def get_output_names() -> tuple[str, ...]:
+    """Available MIDI output port names (briefly cached)."""
+    return _cached_port_names("output", mido.get_output_names)
+
 
 class MidiMessageType(Enum):
     """Types of MIDI messages we handle."""
@@ -21,7 +95,7 @@ class MidiMessageType(Enum):
     OTHER = "other"
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class NoteEvent:
     """Represents a Note-On or Note-Off event."""
     note: int
@@ -29,7 +103,7 @@ class NoteEvent:
     channel: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CCEvent:
     """Represents a Control Change event."""
     control: int
@@ -40,15 +114,31 @@ class CCEvent:
 class MidiHandler:
     """Handles MIDI input from the controller.
     
-    Opens a MIDI input port and provides methods for polling
-    and processing incoming messages.
+    Opens MIDI input ports in callback mode: the backend's MIDI thread
+    pushes incoming messages into a bounded ring (deque), and poll()
+    drains it from the main loop without touching the ports. Arrivals
+    also set a wake event so the main loop can block in wait(). rtmidi's
+    own input queue (and its size limit) is unused in callback mode.
     """
     
+    __slots__ = (
+        "port_pattern", "f1_cc", "debug", "port_name", "is_open",
+        "_ports", "_output_ports", "_rt_outs", "_port_names",
+        "_tx", "_tx_thread", "tx_overruns",
+        "_rx", "_wake", "rx_overruns", "_rx_overruns_reported",
+        "_debug_log", "_debug_thread", "_debug_stop",
+        "_last_send_error", "_last_send_error_time", "_send_errors_suppressed",
+        "_stacking_mix_cc", "_stacking_mode_cc", "_panic_cc", "_split_mode_cc",
+        "_note_on_handler", "_note_off_handler", "_cc_dispatch",
+        "_last_cc", "_cc_repeatable", "_type_dispatch",
+    )
+    
     def __init__(
         self,
         port_pattern: Optional[str] = config.MIDI_PORT_PATTERN,
         f1_cc: int = config.F1_CC_NUMBER,
         debug: bool = False,
+        wake: Optional[threading.Event] = None,
     ):
         """Initialize the MIDI handler.
         
@@ -56,13 +146,107 @@ class MidiHandler:
             port_pattern: Substring to match in port names, or None for first port
             f1_cc: CC number used for f₁ modulation
             debug: If True, print raw MIDI messages to console
+            wake: Event set on every received message; pass the same event to
+                several handlers to wait on all of them at once
         """
         self.port_pattern = port_pattern
         self.f1_cc = f1_cc
         self.debug = debug
         self._ports: list[mido.ports.BaseInput] = []
         self._output_ports: list[mido.ports.BaseOutput] = []
+        # Backend (rtmidi) handles of the output ports, for pre-encoded sends
+        self._rt_outs: list = []
+        # Outgoing FIFO, written to the ports by a sender thread started in
+        # open(), so USB/ALSA writes never block the caller; None stops it
+        self._tx: queue.Queue = queue.Queue(maxsize=TX_QUEUE_SIZE)
+        self._tx_thread: Optional[threading.Thread] = None
+        # Messages dropped because the outgoing FIFO was full (oldest-first)
+        self.tx_overruns = 0
         self._port_names: list[str] = []
+        # Plain attributes (kept in sync by open()/close()) rather than properties
+        self.port_name: Optional[str] = None  # Open port names, comma separated
+        self.is_open = False  # Whether any input port is open
+        # Filled by the MIDI thread, drained by poll() (deque ops are atomic)
+        self._rx: deque = deque(maxlen=RX_QUEUE_SIZE)
+        self._wake = wake if wake is not None else threading.Event()
+        # Messages dropped because the ring was full (oldest-first)
+        self.rx_overruns = 0
+        self._rx_overruns_reported = 0
+        
+        # Rate limiting for "Error sending MIDI" (see _report_send_error)
+        self._last_send_error = ""
+        self._last_send_error_time = 0.0
+        self._send_errors_suppressed = 0
+        
+        # Debug trace: hot paths append (direction, message); a writer thread
+        # (run between open() and close()) formats and writes them every
+        # DEBUG_FLUSH_INTERVAL
+        self._debug_log: deque = deque(maxlen=DEBUG_LOG_SIZE)
+        self._debug_thread: Optional[threading.Thread] = None
+        self._debug_stop = threading.Event()
+        
+        # Control numbers checked by the is_* predicates, read once from config
+        self._stacking_mix_cc = config.STACKING_MIX_CC
+        self._stacking_mode_cc = config.STACKING_MODE_CC
+        self._panic_cc = config.PANIC_NOTE
+        self._split_mode_cc = config.SPLIT_MODE_TOGGLE_CC
+        
+        # Routing for dispatch(): message type -> router, and 128-entry
+        # tables indexed by CC number (handler or None, repeatable flag)
+        self._note_on_handler: Optional[Callable[[int, int, int], None]] = None
+        self._note_off_handler: Optional[Callable[[int, int], None]] = None
+        self._cc_dispatch: list[Optional[Callable[[int], None]]] = [None] * 128
+        # Last value seen per (channel << 7 | CC), -1 if none, to drop
+        # repeated values; CCs flagged in _cc_repeatable (buttons) always pass
+        self._last_cc: list[int] = [-1] * _CC_SLOTS
+        self._cc_repeatable: list[bool] = [False] * 128
+        self._type_dispatch: dict[str, Callable[[mido.Message], None]] = {
+            "note_on": self._dispatch_note_on,
+            "note_off": self._dispatch_note_off,
+            "control_change": self._dispatch_cc,
+        }
+        
+    def _on_message(self, msg: mido.Message) -> None:
+        """Input callback, runs on the backend's MIDI thread."""
+        if msg.type in DROPPED_MESSAGE_TYPES:
+            return
+        rx = self._rx
+        if len(rx) == RX_QUEUE_SIZE:
+            self.rx_overruns += 1  # append() below evicts the oldest message
+        rx.append(msg)
+        self._wake.set()
+    
+    def _debug_writer(self, stop: threading.Event) -> None:
+        """Periodically write the buffered debug trace to stdout (daemon thread).
+        
+        Args:
+            stop: Set by close(); the remaining trace is written before exiting
+        """
+        trace = self._debug_log
+        popleft = trace.popleft
+        stopping = False
+        while not stopping:
+            stopping = stop.wait(DEBUG_FLUSH_INTERVAL)
+            lines = []
+            while trace:
+                direction, msg = popleft()
+                lines.append(f"[MIDI {direction}] {msg}\n")
+            if lines:
+                sys.stdout.write("".join(lines))
+                sys.stdout.flush()
+    
+    def wait(self, timeout: float) -> bool:
+        """Block until a message arrives or the timeout expires.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if woken by incoming MIDI, False on timeout
+        """
+        woken = self._wake.wait(timeout)
+        self._wake.clear()
+        return woken
         
     def open(self) -> str:
         """Open all available MIDI input ports.
@@ -73,7 +257,7 @@ class MidiHandler:
         Raises:
             RuntimeError: If no MIDI ports are found
         """
-        available_ports = mido.get_input_names()
+        available_ports = get_input_names()
         
         if not available_ports:
             raise RuntimeError("No MIDI input ports available")
@@ -81,23 +265,46 @@ class MidiHandler:
         self._ports = []
         self._port_names = []
         self._output_ports = []
+        self._rt_outs = []
+        # A reconnected controller starts without a last value per CC
+        self._last_cc[:] = [-1] * _CC_SLOTS
+        
+        # Case-insensitive matching: fold the pattern once, each name once
+        pattern_cf = self.port_pattern.casefold() if self.port_pattern else None
+        
+        # Output names for feedback, enumerated once for all inputs
+        try:
+            output_ports = get_output_names()
+        except _PORT_OPEN_ERRORS as e:
+            output_ports = ()
+            if self.debug:
+                print(f"[MIDI] Could not list output ports: {e}")
+        output_set = frozenset(output_ports)
         
         # Iterate over all available ports
         for name in available_ports:
+            name_cf = name.casefold()
+            
             # If a pattern is specified, skip non-matching ports
-            if self.port_pattern and self.port_pattern.lower() not in name.lower():
+            if pattern_cf and pattern_cf not in name_cf:
                 continue
 
             # Prevent feedback loops by ignoring system passthrough ports
-            lower_name = name.lower()
-            if "midi through" in lower_name or "rtmidi" in lower_name:
+            if any(marker in name_cf for marker in LOOPBACK_PORT_MARKERS):
                  if self.debug:
                      print(f"[MIDI] Skipping potential loopback port: {name}")
                  continue
                 
             try:
                 # Open input port
-                in_port = mido.open_input(name)
+                in_port = mido.open_input(name, callback=self._on_message)
+                # With rtmidi, have the backend drop SysEx, clock/time code
+                # and active sensing before mido parses them (mido only
+                # ignores active sensing); DROPPED_MESSAGE_TYPES still
+                # filters the rest, and other backends
+                rt = getattr(in_port, "_rt", None)
+                if rt is not None and hasattr(rt, "ignore_types"):
+                    rt.ignore_types(sysex=True, timing=True, active_sense=True)
                 self._ports.append(in_port)
                 self._port_names.append(name)
                 if self.debug:
@@ -105,29 +312,41 @@ class MidiHandler:
 
                 # Try to open output port with same name for feedback
                 try:
-                    output_ports = mido.get_output_names()
                     # Try exact match first
-                    if name in output_ports:
-                        out_port = mido.open_output(name)
-                        self._output_ports.append(out_port)
+                    if name in output_set:
+                        self._add_output(mido.open_output(name))
                         if self.debug:
                             print(f"[MIDI] Opened output port: {name}")
                     else:
                         # Try approximate match
                         for out_name in output_ports:
                             if name[:-2] in out_name: # Simple heuristic
-                                out_port = mido.open_output(out_name)
-                                self._output_ports.append(out_port)
+                                self._add_output(mido.open_output(out_name))
                                 if self.debug:
                                     print(f"[MIDI] Opened output port (approx): {out_name}")
                                 break
-                except Exception as e:
+                except _PORT_OPEN_ERRORS as e:
                     if self.debug:
                         print(f"[MIDI] Could not open output port for {name}: {e}")
                         
-            except Exception as e:
+            except _PORT_OPEN_ERRORS as e:
                 print(f"[MIDI] Error opening port {name}: {e}")
 
+        self.is_open = bool(self._ports)
+        self.port_name = ", ".join(self._port_names) or None
+        
+        if self.debug and self._debug_thread is None:
+            self._debug_stop = threading.Event()
+            self._debug_thread = threading.Thread(
+                target=self._debug_writer, args=(self._debug_stop,), name="midi-debug", daemon=True
+            )
+            self._debug_thread.start()
+        
+        if self._output_ports and self._tx_thread is None:
+            self._tx = queue.Queue(maxsize=TX_QUEUE_SIZE)
+            self._tx_thread = threading.Thread(target=self._sender_loop, name="midi-tx", daemon=True)
+            self._tx_thread.start()
+
         if not self._ports:
              # If we tried to filter but found nothing, or just failed to open anything
              if self.port_pattern:
@@ -137,44 +356,287 @@ class MidiHandler:
 
         return ", ".join(self._port_names)
     
+    def _add_output(self, port: mido.ports.BaseOutput) -> None:
+        """Register an opened output port for send_message()."""
+        self._output_ports.append(port)
+        # mido's rtmidi backend exposes the rtmidi.MidiOut as _rt; sending
+        # raw bytes through it skips mido's per-port copy and re-encode
+        rt = getattr(port, "_rt", None)
+        if rt is not None and hasattr(rt, "send_message"):
+            self._rt_outs.append(rt)
+    
     def close(self) -> None:
-        """Close all MIDI input and output ports."""
-        for port in self._ports:
-            port.close()
-        self._ports.clear()
+        """Close all MIDI input and output ports.
         
-        for port in self._output_ports:
-            port.close()
+        Ports are closed on daemon threads (backend teardown can block),
+        waiting at most PORT_CLOSE_TIMEOUT for them; a port still closing
+        after that neither delays this call nor keeps the interpreter from
+        exiting. Messages already queued by send_message() are written
+        first, and output ports are only closed once the sender thread has
+        exited.
+        """
+        deadline = time.monotonic() + PORT_CLOSE_TIMEOUT
+        sender = self._tx_thread
+        if sender is not None:
+            self._enqueue(None)
+            sender.join(max(0.0, deadline - time.monotonic()))
+            self._tx_thread = None
+            if not sender.is_alive():
+                sender = None
+        
+        closers = [
+            threading.Thread(target=self._close_port, args=(port, None), name="midi-close", daemon=True)
+            for port in self._ports
+        ] + [
+            threading.Thread(target=self._close_port, args=(port, sender), name="midi-close", daemon=True)
+            for port in self._output_ports
+        ]
+        for closer in closers:
+            closer.start()
+        for closer in closers:
+            closer.join(max(0.0, deadline - time.monotonic()))
+        still_closing = sum(closer.is_alive() for closer in closers)
+        if still_closing:
+            print(f"[MIDI] {still_closing} port(s) still closing after {PORT_CLOSE_TIMEOUT}s")
+        self._ports.clear()
         self._output_ports.clear()
+        self._rt_outs.clear()
         self._port_names.clear()
+        self.port_name = None
+        self.is_open = False
+        self._rx.clear()
+        self._last_cc[:] = [-1] * _CC_SLOTS
+        
+        # Stop the debug writer last, so the trace of the final sends is flushed
+        if self._debug_thread is not None:
+            self._debug_stop.set()
+            self._debug_thread.join(timeout=PORT_CLOSE_TIMEOUT)
+            self._debug_thread = None
+    
+    @staticmethod
+    def _close_port(port, after: Optional[threading.Thread]) -> None:
+        """Close one port (closer thread), first waiting for `after` to exit."""
+        if after is not None:
+            after.join()
+        try:
+            port.close()
+        except Exception as e:
+            print(f"[MIDI] Error closing port: {e}")
+    
+    def poll(self) -> Iterable[mido.Message]:
+        """Drain pending MIDI messages received from all ports (non-blocking).
+        
+        Messages are popped from the receive ring as the caller iterates,
+        without building an intermediate list. All ports feed one ring in
+        arrival order, so a burst on one port never holds back messages
+        that arrived earlier on another. Only the messages pending when
+        iteration starts are drained; anything arriving meanwhile is left
+        for the next call, so a flood cannot stall the caller's loop.
+        
+        Returns:
+            Iterable of pending MIDI messages, oldest first (an empty tuple
+            when nothing is pending)
+        """
+        if not self._rx:
+            return _EMPTY
+        return self._drain()
+    
+    def _drain(self) -> Iterator[mido.Message]:
+        """Generator behind poll()."""
+        rx = self._rx
+        popleft = rx.popleft
+        
+        if self.debug:
+            if self.rx_overruns != self._rx_overruns_reported:
+                self._rx_overruns_reported = self.rx_overruns
+                print(f"[MIDI] Receive ring overrun, {self.rx_overruns} messages dropped so far")
+            trace = self._debug_log.append
+            for _ in range(len(rx)):
+                msg = popleft()
+                trace(("IN", msg))
+                yield msg
+        else:
+            for _ in range(len(rx)):
+                yield popleft()
     
-    def poll(self) -> list[mido.Message]:
-        """Poll for pending MIDI messages from all ports (non-blocking).
+    def poll_list(self) -> list[mido.Message]:
+        """Drain pending MIDI messages into a list (see poll()).
         
         Returns:
             List of pending MIDI messages
         """
-        all_messages = []
-        for port in self._ports:
-            all_messages.extend(list(port.iter_pending()))
-            
-        messages = all_messages
+        return list(self.poll())
+    
+    def set_handlers(
+        self,
+        note_on: Optional[Callable[[int, int, int], None]] = None,
+        note_off: Optional[Callable[[int, int], None]] = None,
+        cc_handlers: Optional[dict[int, Callable[[int], None]]] = None,
+        cc_repeatable: frozenset[int] = frozenset(),
+    ) -> None:
+        """Register the handlers used by dispatch().
+        
+        A CC whose value repeats the last one seen on its channel is dropped
+        (held encoders/pedals resend the same value), except for CC numbers
+        in cc_repeatable, e.g. buttons where every press matters.
+        
+        Args:
+            note_on: Called as note_on(note, velocity, channel), or None to ignore
+            note_off: Called as note_off(note, channel), or None to ignore
+            cc_handlers: CC number -> handler(value); unlisted CCs are ignored
+            cc_repeatable: CC numbers delivered even when the value repeats
+        """
+        self._note_on_handler = note_on
+        self._note_off_handler = note_off
+        cc_dispatch: list[Optional[Callable[[int], None]]] = [None] * 128
+        for control, handler in (cc_handlers or {}).items():
+            cc_dispatch[control] = handler
+        self._cc_dispatch = cc_dispatch
+        self._cc_repeatable = [control in cc_repeatable for control in range(128)]
+        self._last_cc[:] = [-1] * _CC_SLOTS
+    
+    def dispatch(self) -> None:
+        """Drain pending messages and route each to its registered handler.
         
+        One dict lookup on the message type, and for CCs one more on the
+        control number, instead of testing every is_* predicate in turn.
+        """
+        rx = self._rx
+        if not rx:
+            return
+        get_router = self._type_dispatch.get
         if self.debug:
-            for msg in messages:
-                print(f"[MIDI IN] {msg}")
-                
-        return messages
+            for msg in self.poll():
+                router = get_router(msg.type)
+                if router is not None:
+                    router(msg)
+            return
+        
+        # Fast path: pop the ring directly instead of resuming poll()'s
+        # generator per message (same bound: messages pending at entry)
+        popleft = rx.popleft
+        for _ in range(len(rx)):
+            msg = popleft()
+            router = get_router(msg.type)
+            if router is not None:
+                router(msg)
+    
+    def _dispatch_note_on(self, msg: mido.Message) -> None:
+        """Route a Note-On (velocity 0 counts as Note-Off)."""
+        # Read each mido attribute once (they go through descriptor lookups)
+        velocity = msg.velocity
+        if velocity > 0:
+            handler = self._note_on_handler
+            if handler is not None:
+                handler(msg.note, velocity, msg.channel)
+        else:
+            handler = self._note_off_handler
+            if handler is not None:
+                handler(msg.note, msg.channel)
+    
+    def _dispatch_note_off(self, msg: mido.Message) -> None:
+        """Route a Note-Off."""
+        handler = self._note_off_handler
+        if handler is not None:
+            handler(msg.note, msg.channel)
+    
+    def _dispatch_cc(self, msg: mido.Message) -> None:
+        """Route a Control Change by CC number, dropping repeated values."""
+        control = msg.control
+        handler = self._cc_dispatch[control]
+        if handler is None:
+            return
+        value = msg.value
+        key = (msg.channel << 7) | control
+        last_cc = self._last_cc
+        if last_cc[key] == value and not self._cc_repeatable[control]:
+            return
+        last_cc[key] = value
+        handler(value)
 
     def send_message(self, msg: mido.Message) -> None:
-        """Send a MIDI message to all output ports."""
-        for port in self._output_ports:
+        """Queue a MIDI message for all output ports (non-blocking).
+        
+        Messages are written in order by the sender thread.
+        """
+        if self._tx_thread is not None:
+            self._enqueue(msg)
+    
+    def _enqueue(self, msg: Optional[mido.Message]) -> None:
+        """Put a message (or the None stop marker) on the outgoing FIFO.
+        
+        Never blocks: if the sender has fallen TX_QUEUE_SIZE messages
+        behind, the oldest queued message is dropped to make room.
+        """
+        tx = self._tx
+        try:
+            tx.put_nowait(msg)
+        except queue.Full:
             try:
-                port.send(msg)
-                if self.debug:
-                    print(f"[MIDI OUT] {msg}")
-            except Exception as e:
-                print(f"Error sending MIDI: {e}")
+                tx.get_nowait()
+                self.tx_overruns += 1
+            except queue.Empty:
+                pass
+            tx.put_nowait(msg)
+    
+    def _sender_loop(self) -> None:
+        """Write queued messages to the output ports until None (sender thread)."""
+        get = self._tx.get
+        write = self._write_message
+        # The debug check is made once here, not per message
+        trace = self._debug_log.append if self.debug else None
+        while True:
+            msg = get()
+            if msg is None:
+                return
+            write(msg)
+            if trace is not None:
+                trace(("OUT", msg))
+    
+    def _write_message(self, msg: mido.Message) -> None:
+        """Write one message to all output ports.
+        
+        The message is encoded once and the bytes written to every rtmidi
+        output; ports from other backends fall back to port.send().
+        """
+        output_ports = self._output_ports
+        if not output_ports:
+            return
+        rt_outs = self._rt_outs
+        if len(rt_outs) == len(output_ports):
+            data = msg.bytes()
+            for rt in rt_outs:
+                try:
+                    rt.send_message(data)
+                except Exception as e:
+                    self._report_send_error(e)
+        else:
+            for port in output_ports:
+                try:
+                    port.send(msg)
+                except Exception as e:
+                    self._report_send_error(e)
+    
+    def _report_send_error(self, error: Exception) -> None:
+        """Print a send error, dropping repeats of the same error for a while.
+        
+        A disconnected device fails every send; printing each one would
+        flood the console from the LED feedback path.
+        """
+        text = str(error)
+        now = time.monotonic()
+        if (text == self._last_send_error
+                and now - self._last_send_error_time < SEND_ERROR_REPEAT_INTERVAL):
+            self._send_errors_suppressed += 1
+            return
+        suppressed = self._send_errors_suppressed
+        if suppressed:
+            print(f"Error sending MIDI: {text} ({suppressed} similar errors suppressed)")
+        else:
+            print(f"Error sending MIDI: {text}")
+        self._last_send_error = text
+        self._last_send_error_time = now
+        self._send_errors_suppressed = 0
     
     def is_note_on(self, msg: mido.Message) -> bool:
         """Check if a message is a Note-On event.
@@ -188,9 +650,8 @@ class MidiHandler:
         
         Note: A Note-On with velocity 0 is treated as Note-Off.
         """
-        return msg.type == "note_off" or (
-            msg.type == "note_on" and msg.velocity == 0
-        )
+        msg_type = msg.type
+        return msg_type == "note_off" or (msg_type == "note_on" and msg.velocity == 0)
     
     def is_f1_control(self, msg: mido.Message) -> bool:
         """Check if a message is the f₁ modulation CC."""
@@ -198,53 +659,35 @@ class MidiHandler:
     
     def is_stacking_mix_control(self, msg: mido.Message) -> bool:
         """Check if a message is the Stacking Mix CC (CC67)."""
-        return msg.type == "control_change" and msg.control == config.STACKING_MIX_CC
+        return msg.type == "control_change" and msg.control == self._stacking_mix_cc
 
     def is_stacking_mode_toggle(self, msg: mido.Message) -> bool:
         """Check if a message is the Stacking Mode toggle CC (CC22)."""
-        return msg.type == "control_change" and msg.control == config.STACKING_MODE_CC
+        return msg.type == "control_change" and msg.control == self._stacking_mode_cc
     
 
     def is_panic_cc(self, msg: mido.Message) -> bool:
         """Check if a message is the Panic button CC (e.g. 111)."""
-        return msg.type == "control_change" and msg.control == config.PANIC_NOTE
+        return msg.type == "control_change" and msg.control == self._panic_cc
 
     def is_split_mode_toggle(self, msg: mido.Message) -> bool:
         """Check if a message is Split Mode Toggle (CC 104)."""
-        return msg.type == "control_change" and msg.control == config.SPLIT_MODE_TOGGLE_CC
+        return msg.type == "control_change" and msg.control == self._split_mode_cc
     
     def parse_note_event(self, msg: mido.Message) -> NoteEvent:
         """Parse a Note-On/Off message into a NoteEvent."""
-        return NoteEvent(
-            note=msg.note,
-            velocity=msg.velocity,
-            channel=msg.channel,
-        )
+        # Positional: the field order is (note, velocity, channel)
+        return NoteEvent(msg.note, msg.velocity, msg.channel)
     
     def parse_cc_event(self, msg: mido.Message) -> CCEvent:
         """Parse a CC message into a CCEvent."""
-        return CCEvent(
-            control=msg.control,
-            value=msg.value,
-            channel=msg.channel,
-        )
-    
-    @property
-    def port_name(self) -> Optional[str]:
-        """Names of currently open ports (comma separated)."""
-        if not self._port_names:
-            return None
-        return ", ".join(self._port_names)
-    
-    @property
-    def is_open(self) -> bool:
-        """Whether any port is currently open."""
-        return len(self._ports) > 0
+        # Positional: the field order is (control, value, channel)
+        return CCEvent(msg.control, msg.value, msg.channel)
     
     @staticmethod
     def list_ports() -> list[str]:
         """List all available MIDI input ports."""
-        return mido.get_input_names()
+        return list(get_input_names())
     
     def __enter__(self) -> "MidiHandler":
         """Context manager entry."""
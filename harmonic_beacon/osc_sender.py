@@ -13,16 +13,34 @@ Surge XT OSC Spec (v1.3+):
 from typing import Optional
 
 try:
-    from pythonosc import udp_client
+    from pythonosc import osc_bundle_builder, osc_message_builder, udp_client
     HAS_OSC = True
 except ImportError:
     HAS_OSC = False
     udp_client = None  # type: ignore
+    osc_bundle_builder = None  # type: ignore
+    osc_message_builder = None  # type: ignore
 
 from . import config
 from .harmonics import frequency_to_midi_float
 
 
+def _build_message(address: str, args: list):
+    """Build an OscMessage (for packing into a bundle)."""
+    builder = osc_message_builder.OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build()
+
+
+def _send_bundle(client, messages: list) -> None:
+    """Send a list of OscMessages as one immediate bundle (one datagram)."""
+    builder = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+    for msg in messages:
+        builder.add_content(msg)
+    client.send(builder.build())
+
+
 class OscSender:
     """Sends OSC messages to Surge XT.
     
@@ -133,6 +151,46 @@ class OscSender:
             [float(frequency), float(release_velocity), float(voice_id)]
         )
     
+    def send_voice_on_bulk(
+        self,
+        records: list[tuple[int, float, float, int, int]],
+    ) -> None:
+        """Send note-ons (and visualizer voice-ons) for a whole chord at once.
+        
+        Packs all /fnote messages into a single OSC bundle (and all
+        /beacon/voice/on messages into another), so a chord costs one
+        datagram per destination instead of one per voice.
+        
+        Args:
+            records: (voice_id, frequency, velocity, source_note, harmonic_n)
+                tuples, velocity normalized 0-1
+        """
+        if self._client is None or not records:
+            return
+        
+        if len(records) == 1:
+            voice_id, freq, vel, source_note, harmonic_n = records[0]
+            self.send_note_on(voice_id, freq, vel)
+            self.broadcast_voice_on(voice_id, freq, vel, source_note, harmonic_n)
+            return
+        
+        _send_bundle(self._client, [
+            _build_message(
+                "/fnote",
+                [float(freq), float(vel * 127.0 if vel <= 1.0 else vel), float(voice_id)],
+            )
+            for voice_id, freq, vel, _, _ in records
+        ])
+        
+        if self._broadcast_client is not None:
+            _send_bundle(self._broadcast_client, [
+                _build_message(
+                    "/beacon/voice/on",
+                    [int(voice_id), float(freq), float(vel), int(source_note), int(harmonic_n)],
+                )
+                for voice_id, freq, vel, source_note, harmonic_n in records
+            ])
+    
     def send_all_notes_off(self) -> None:
         """Send all-notes-off message to release all sounding notes."""
         if self._client is None:
@@ -161,6 +219,27 @@ class OscSender:
             "/ne/pitch",
             [float(voice_id), float(semitone_offset)]
         )
+    
+    def send_pitch_expression_bulk(
+        self,
+        updates: list[tuple[int, float]],
+    ) -> None:
+        """Send pitch expressions for many voices as one OSC bundle.
+        
+        Args:
+            updates: (voice_id, semitone_offset) pairs
+        """
+        if self._client is None or not updates:
+            return
+        
+        if len(updates) == 1:
+            self.send_pitch_expression(*updates[0])
+            return
+        
+        _send_bundle(self._client, [
+            _build_message("/ne/pitch", [float(voice_id), float(offset)])
+            for voice_id, offset in updates
+        ])
         
     def send_parameter(
         self,
@@ -247,6 +326,19 @@ class OscSender:
             [int(voice_id), float(freq)]
         )
     
+    def broadcast_voice_freq_bulk(self, updates: list[tuple[int, float]]) -> None:
+        """Broadcast several frequency updates to visualizer as one bundle.
+        
+        Args:
+            updates: (voice_id, freq) pairs
+        """
+        if self._broadcast_client is None or not updates:
+            return
+        _send_bundle(self._broadcast_client, [
+            _build_message("/beacon/voice/freq", [int(voice_id), float(freq)])
+            for voice_id, freq in updates
+        ])
+    
     def broadcast_key_on(self, note: int, velocity: int) -> None:
         """Broadcast key press to visualizer."""
         if self._broadcast_client is None:
@@ -371,6 +463,14 @@ class MockOscSender(OscSender):
         if self.verbose:
             print(f"[MockOSC] /fnote/rel {frequency:.2f} {release_velocity:.0f} {voice_id}")
     
+    def send_voice_on_bulk(
+        self,
+        records: list[tuple[int, float, float, int, int]],
+    ) -> None:
+        """Log each note-on of a bulk send."""
+        for voice_id, freq, vel, _, _ in records:
+            self.send_note_on(voice_id, freq, vel)
+    
     def send_all_notes_off(self) -> None:
         """Log all-notes-off message."""
         msg = {"type": "all_notes_off", "address": "/allnotesoff"}
@@ -393,6 +493,14 @@ class MockOscSender(OscSender):
         self._message_log.append(msg)
         if self.verbose:
             print(f"[MockOSC] /ne/pitch {voice_id} {semitone_offset:.2f}")
+    
+    def send_pitch_expression_bulk(
+        self,
+        updates: list[tuple[int, float]],
+    ) -> None:
+        """Log each pitch expression of a bulk send."""
+        for voice_id, semitone_offset in updates:
+            self.send_pitch_expression(voice_id, semitone_offset)
             
     def send_parameter(
         self,
@@ -449,6 +557,10 @@ class MockOscSender(OscSender):
         """Mock broadcast voice frequency update (no-op)."""
         pass
 
+    def broadcast_voice_freq_bulk(self, updates: list[tuple[int, float]]) -> None:
+        """Mock broadcast of bulk frequency updates (no-op)."""
+        pass
+
     def broadcast_key_on(self, note: int, velocity: int) -> None:
         """Mock broadcast key on (no-op)."""
         pass
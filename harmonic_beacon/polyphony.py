@@ -5,12 +5,13 @@ and frequencies for proper Note-On/Note-Off handling.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ItemsView, Optional
 
 from . import config
+from .harmonics import frequency_to_midi_float
 
 
-@dataclass
+@dataclass(slots=True)
 class VoicePair:
     """Represents the voices triggered by a single MIDI note.
     
@@ -27,6 +28,15 @@ class VoicePair:
     # Store original f₁ for real-time pitch modulation
     original_f1: float = 54.0
     
+    # Cached at note-on as fractional MIDI notes: each voice's f₁
+    # (frequency / n), so an f₁ change is one subtraction per voice, and
+    # the primary frequency, the reference for LFO chorus offsets
+    f1_midis: list[float] = field(default_factory=list)
+    beacon_midi: float = 0.0
+    
+    # Last pitch-expression offset sent for this note (semitones)
+    last_offset: float = 0.0
+    
     # Transposed layer (for borrowed keys)
     transposed_voice_id: int = -1
     transposed_frequency: float = 0.0
@@ -92,6 +102,10 @@ class VoiceTracker:
         # Allocate voice IDs
         voice_ids = [self._allocate_voice_id() for _ in frequencies]
         
+        # Voices with no usable frequency or harmonic number (0 Hz, n=0)
+        # fall back to the note-on f₁ rather than failing the note
+        original_f1_midi = frequency_to_midi_float(original_f1)
+        
         # Create VoicePair
         pair = VoicePair(
             midi_note=midi_note,
@@ -100,6 +114,13 @@ class VoiceTracker:
             frequencies=list(frequencies),
             harmonic_ns=list(harmonic_ns),
             original_f1=original_f1,
+            f1_midis=[
+                frequency_to_midi_float(freq / n) if freq > 0 and n > 0 else original_f1_midi
+                for freq, n in zip(frequencies, harmonic_ns)
+            ],
+            beacon_midi=(
+                frequency_to_midi_float(frequencies[0]) if frequencies[0] > 0 else original_f1_midi
+            ),
         )
         
         self._active_notes[midi_note] = pair
@@ -115,6 +136,14 @@ class VoiceTracker:
         """Get all currently active notes."""
         return self._active_notes.copy()
     
+    def iter_active(self) -> ItemsView[int, VoicePair]:
+        """Live (note, VoicePair) view of active notes, without copying.
+        
+        Do not note_on/note_off while iterating it; use get_active_notes()
+        for a snapshot in that case.
+        """
+        return self._active_notes.items()
+    
     def get_voice_pair(self, midi_note: int) -> Optional[VoicePair]:
         """Get the voice pair for a specific MIDI note."""
         return self._active_notes.get(midi_note)
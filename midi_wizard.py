@@ -42,14 +42,16 @@ cc_queue: queue.Queue[int] = queue.Queue()
 stop_event = threading.Event()
 
 
+def on_midi(msg) -> None:
+    """Input callback (backend MIDI thread): queue CC numbers."""
+    if msg.type == "control_change":
+        cc_queue.put(msg.control)
+
+
 def midi_reader(port_name: str) -> None:
-    with mido.open_input(port_name) as port:
-        while not stop_event.is_set():
-            msg = port.receive(block=False)
-            if msg and msg.type == "control_change":
-                cc_queue.put(msg.control)
-            else:
-                time.sleep(0.005)
+    # Callback mode: the backend wakes us per message, no receive() polling
+    with mido.open_input(port_name, callback=on_midi):
+        stop_event.wait()
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
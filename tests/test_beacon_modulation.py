@@ -0,0 +1,154 @@
+"""Tests for f₁ modulation, pitch-expression updates and voice cleanup
+in HarmonicBeacon.
+
+Uses MockOscSender; no MIDI ports are opened.
+"""
+
+import pytest
+
+from harmonic_beacon import config
+from harmonic_beacon.harmonics import get_standard_frequency
+from harmonic_beacon.main import F1Modulator, HarmonicBeacon
+
+
+@pytest.fixture
+def beacon():
+    """Keyboard-mode beacon with a mock OSC sender and no secondary port."""
+    b = HarmonicBeacon(mock_osc=True, modulation_port_pattern=None, verbose=False)
+    b.osc.verbose = False
+    b.osc.open()
+    b.pad_mode_enabled = False
+    b._select_note_handlers()
+    return b
+
+
+def settle(beacon: HarmonicBeacon) -> None:
+    """Run the f₁ smoothing until f₁ reaches its target.
+
+    Voices are updated only on steps where f₁ changed, as in run().
+    """
+    for _ in range(10000):
+        if beacon.f1.update():
+            beacon._update_active_voices()
+        if beacon.f1.is_stable:
+            break
+
+
+def pitch_offsets(beacon: HarmonicBeacon) -> list[float]:
+    """Semitone offsets of all /ne/pitch messages logged so far."""
+    return [
+        m["semitone_offset"] for m in beacon.osc.get_log()
+        if m["type"] == "pitch_expression"
+    ]
+
+
+class TestF1Modulator:
+    """Tests for f₁ smoothing."""
+
+    def test_snaps_to_target(self):
+        """The value lands exactly on the target and then stays idle."""
+        f1 = F1Modulator(initial=50.0, smoothing_rate=0.1)
+        f1.set_target(60.0)
+        assert not f1.is_stable
+        for _ in range(1000):
+            f1.update()
+            if f1.is_stable:
+                break
+        assert f1.value == 60.0
+        assert f1.update() is False
+
+    def test_target_is_clamped(self):
+        """Targets outside the allowed range are clamped."""
+        f1 = F1Modulator(initial=50.0, min_freq=20.0, max_freq=100.0)
+        f1.set_target(500.0)
+        assert f1.target == 100.0
+
+
+class TestModulationNote:
+    """Tests for re-rooting f₁ from the secondary controller."""
+
+    def test_octave_above_anchor(self, beacon):
+        """A note three octaves above the anchor's C becomes harmonic 8."""
+        beacon._key_mapper.anchor_midi = 24
+        beacon._handle_modulation_note(60)
+        assert beacon.f1.target == pytest.approx(get_standard_frequency(60) / 8)
+
+    def test_new_pitch_class(self, beacon):
+        """Modulating to G moves f₁ to G (transposed into range)."""
+        beacon._key_mapper.anchor_midi = 24
+        beacon._handle_modulation_note(43)
+        assert beacon.f1.target == pytest.approx(get_standard_frequency(43) / 2)
+        assert beacon._key_mapper.anchor_midi % 12 == 7
+
+
+class TestActiveVoiceUpdates:
+    """Tests for pitch expressions sent while f₁ moves."""
+
+    def test_held_voice_follows_f1(self, beacon):
+        """A held note receives the offset of the new f₁."""
+        beacon._handle_modulation_note(36)
+        settle(beacon)
+        beacon._handle_note_on(62, 100)
+        beacon.osc.clear_log()
+        beacon._handle_modulation_note(43)
+        settle(beacon)
+        assert pitch_offsets(beacon)[-1] == pytest.approx(7.0)
+
+    def test_voice_started_after_idle_modulation(self, beacon):
+        """A note started while f₁ moved unheld is not skipped on return.
+
+        f₁ goes C -> G with nothing held, a note starts at G, then f₁
+        returns to C: the note must be sent -7 semitones even though f₁
+        matches the last value broadcast before it started.
+        """
+        beacon._handle_note_on(60, 100)
+        beacon._handle_modulation_note(36)
+        settle(beacon)
+        beacon._handle_note_off(60)
+
+        beacon._handle_modulation_note(43)
+        settle(beacon)
+        beacon._handle_note_on(62, 100)
+        beacon.osc.clear_log()
+
+        beacon._handle_modulation_note(36)
+        settle(beacon)
+        assert pitch_offsets(beacon)[-1] == pytest.approx(-7.0)
+
+    def test_update_threshold(self, beacon):
+        """f₁ moves below the cents threshold send nothing; larger ones do."""
+        cents = config.F1_UPDATE_THRESHOLD_CENTS
+        start = beacon.f1.value
+        beacon._handle_note_on(62, 100)
+
+        def move_to(offset_cents: float) -> None:
+            beacon.f1.set_target(start * 2.0 ** (offset_cents / 1200.0))
+            settle(beacon)
+
+        move_to(-4 * cents)
+        assert pitch_offsets(beacon)
+        beacon.osc.clear_log()
+
+        move_to(-4.8 * cents)
+        assert pitch_offsets(beacon) == []
+
+        move_to(-8 * cents)
+        assert pitch_offsets(beacon)[-1] == pytest.approx(-8 * cents / 100, abs=cents / 100)
+
+
+class TestVoiceCleanup:
+    """Tests for releasing per-note LFO state when voices are reset."""
+
+    def test_split_toggle_releases_chorus_notes(self, beacon):
+        """Toggling split mode with a chorus note held drops its LFO."""
+        beacon.stacking_mode_enabled = True
+        beacon._handle_note_on(48, 100)
+        assert beacon._active_chorus_notes
+
+        beacon._handle_split_mode_toggle(127)
+        assert not beacon._active_chorus_notes
+        assert not beacon._note_lfos
+
+        # The late note-off finds no voices and leaves nothing behind
+        beacon._handle_note_off(48)
+        assert not beacon._note_lfos
@@ -4,6 +4,7 @@ import math
 import pytest
 
 from harmonic_beacon.harmonics import (
+    HARMONIC_CENTS,
     HARMONIC_MAP,
     get_harmonic_number,
     get_octave,
@@ -204,6 +205,19 @@ class TestCentsDifference:
         assert cents == pytest.approx(386.3, rel=0.01)
 
 
+class TestHarmonicCents:
+    """Tests for the HARMONIC_CENTS lookup table."""
+    
+    def test_fundamental_is_zero(self):
+        """Harmonic 1 is 0 cents above the fundamental."""
+        assert HARMONIC_CENTS[0] == 0.0
+        
+    def test_matches_log2(self):
+        """Entries match 1200 * log2(n)."""
+        for n in (2, 3, 5, 7, 1024):
+            assert HARMONIC_CENTS[n - 1] == pytest.approx(1200.0 * math.log2(n))
+
+
 class TestPlayableFrequency:
     """Tests for playable_frequency function."""
 
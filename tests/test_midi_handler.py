@@ -0,0 +1,104 @@
+"""Tests for MidiHandler message routing.
+
+Messages are injected through the input callback; no MIDI ports are opened.
+"""
+
+import mido
+import pytest
+
+from harmonic_beacon import config
+from harmonic_beacon.main import HarmonicBeacon
+from harmonic_beacon.midi_handler import MidiHandler
+
+F1_CC = config.F1_CC_NUMBER
+PANIC_CC = config.PANIC_NOTE
+SPLIT_CC = config.SPLIT_MODE_TOGGLE_CC
+
+
+@pytest.fixture
+def routed():
+    """Handler routing F1, panic and split CCs into a list of (cc, value)."""
+    handler = MidiHandler(port_pattern=None)
+    received = []
+    handler.set_handlers(
+        cc_handlers={
+            cc: (lambda value, cc=cc: received.append((cc, value)))
+            for cc in (F1_CC, PANIC_CC, SPLIT_CC)
+        },
+        cc_repeatable=frozenset((PANIC_CC, SPLIT_CC)),
+    )
+    return handler, received
+
+
+def send_cc(handler: MidiHandler, control: int, value: int, channel: int = 0) -> None:
+    """Feed a CC through the input callback and dispatch it."""
+    handler._on_message(mido.Message("control_change", control=control, value=value, channel=channel))
+    handler.dispatch()
+
+
+class TestRepeatedCC:
+    """Tests for dropping repeated CC values."""
+
+    def test_repeated_value_dropped(self, routed):
+        """A held encoder resending the same f₁ value is delivered once."""
+        handler, received = routed
+        for value in (64, 64, 64, 65):
+            send_cc(handler, F1_CC, value)
+        assert received == [(F1_CC, 64), (F1_CC, 65)]
+
+    def test_button_presses_repeat(self, routed):
+        """Every panic and split-toggle press is delivered."""
+        handler, received = routed
+        for cc in (PANIC_CC, PANIC_CC, SPLIT_CC, SPLIT_CC):
+            send_cc(handler, cc, 127)
+        assert received == [(PANIC_CC, 127), (PANIC_CC, 127), (SPLIT_CC, 127), (SPLIT_CC, 127)]
+
+    def test_channels_tracked_separately(self, routed):
+        """The same value on another channel is not a repeat."""
+        handler, received = routed
+        send_cc(handler, F1_CC, 10, channel=0)
+        send_cc(handler, F1_CC, 10, channel=1)
+        send_cc(handler, F1_CC, 10, channel=1)
+        assert received == [(F1_CC, 10), (F1_CC, 10)]
+
+    def test_set_handlers_resets(self, routed):
+        """Re-registering handlers forgets the last values."""
+        handler, received = routed
+        send_cc(handler, F1_CC, 10)
+        handler.set_handlers(cc_handlers={F1_CC: lambda value: received.append((F1_CC, value))})
+        send_cc(handler, F1_CC, 10)
+        assert received == [(F1_CC, 10), (F1_CC, 10)]
+
+    def test_close_resets(self, routed):
+        """Closing the handler forgets the last values."""
+        handler, received = routed
+        send_cc(handler, F1_CC, 10)
+        handler.close()
+        send_cc(handler, F1_CC, 10)
+        assert received == [(F1_CC, 10), (F1_CC, 10)]
+
+    def test_reopen_resets(self, routed, monkeypatch):
+        """Reopening the ports (reconnect) forgets the last values."""
+        handler, received = routed
+        monkeypatch.setattr("harmonic_beacon.midi_handler.get_input_names", lambda: ("Controller",))
+        monkeypatch.setattr("harmonic_beacon.midi_handler.get_output_names", lambda: ())
+        monkeypatch.setattr(mido, "open_input", lambda name, callback: mido.ports.BaseInput(name))
+        handler.open()
+        send_cc(handler, F1_CC, 10)
+        handler.open()
+        send_cc(handler, F1_CC, 10)
+        handler.close()
+        assert received == [(F1_CC, 10), (F1_CC, 10)]
+
+
+class TestBeaconCCRouting:
+    """Tests for the CC routing HarmonicBeacon registers."""
+
+    def test_buttons_repeatable_and_f1_deduplicated(self):
+        """Panic and split toggle are exempt from dedupe; f₁ is not."""
+        beacon = HarmonicBeacon(mock_osc=True, modulation_port_pattern=None, verbose=False)
+        repeatable = beacon.midi._cc_repeatable
+        assert repeatable[PANIC_CC]
+        assert repeatable[SPLIT_CC]
+        assert not repeatable[beacon.midi.f1_cc]
+        assert not repeatable[config.STACKING_MIX_CC]